@@ -0,0 +1,201 @@
+"""
+GitHub REST API access
+
+Fetches a user's profile and repositories and turns them into the processed
+structure the portfolio pages render. The user and repository requests are
+independent, so they are issued concurrently and a cache miss costs one round
+trip instead of two.
+
+Repositories are read page by page following the ``Link`` header, newest
+first, and processed as each page arrives. Ingestion stops at the configured
+cap or once repos fall outside the recent-activity window, so large accounts
+never need one huge blocking response.
+
+When a token pool is passed, every request spends and records that pool's
+rate-limit budget, and a degraded pool short-circuits to an error payload so
+callers keep serving their stored snapshot.
+
+``skill_profile`` derives weighted skills from the processed repositories. The
+profile service stores the result with each snapshot, so recommendations read
+it ready-made.
+"""
+
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from github_ratelimit import GitHubTokenPool, RateLimitExceeded
+from http_client import JSONResponse, RevalidatingClient
+
+GITHUB_API_URL = "https://api.github.com"
+MAX_REPOSITORIES = int(os.environ.get("GITHUB_MAX_REPOS", "20"))  # Most recently updated repos kept
+RECENT_REPO_DAYS = int(os.environ.get("GITHUB_RECENT_REPO_DAYS", "0"))  # 0 keeps repos of any age
+PAGE_SIZE = 100  # GitHub's maximum per_page
+SKILL_HALF_LIFE_DAYS = 180  # a repo's skills count half as much for every this many days without updates
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def process_repository(repo: Dict) -> Dict:
+    """Reduce a raw repository object to the fields the pages use"""
+    return {
+        "name": repo["name"],
+        "description": repo["description"] or "No description available",
+        "language": repo["language"] or "Unknown",
+        "stars": repo["stargazers_count"],
+        "forks": repo["forks_count"],
+        "updated_at": repo["updated_at"],
+        "html_url": repo["html_url"],
+        "topics": repo.get("topics", [])
+    }
+
+
+def skill_profile(repositories: List[Dict], now: Optional[datetime] = None) -> Dict[str, float]:
+    """Skills from repo languages and topics, weighted by recency and stars, scaled so the top skill is 1.0"""
+    now = now or datetime.now(timezone.utc)
+    weights: Dict[str, float] = {}
+    names: Dict[str, str] = {}
+    for repo in repositories:
+        try:
+            updated_at = datetime.strptime(repo.get("updated_at") or "", "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+            age_days = max((now - updated_at).total_seconds() / 86400, 0.0)
+        except ValueError:
+            age_days = SKILL_HALF_LIFE_DAYS
+        repo_weight = 0.5 ** (age_days / SKILL_HALF_LIFE_DAYS) * (1 + math.log1p(repo.get("stars") or 0))
+
+        skills: Dict[str, float] = {}
+        language = repo.get("language")
+        if language and language != "Unknown":
+            skills[language] = 1.0
+        # Secondary languages (GraphQL backend only) count by their share of the repo's code
+        languages = repo.get("languages") or {}
+        total_bytes = sum(languages.values())
+        for name, size in languages.items():
+            if total_bytes:
+                skills[name] = max(skills.get(name, 0.0), size / total_bytes)
+        for topic in repo.get("topics") or ():
+            skills[topic.replace("-", " ")] = 1.0
+
+        for skill, share in skills.items():
+            key = skill.lower()
+            names.setdefault(key, skill)
+            weights[key] = weights.get(key, 0.0) + repo_weight * share
+
+    top = max(weights.values(), default=0.0)
+    if not top:
+        return {}
+    ranked = sorted(weights.items(), key=lambda item: item[1], reverse=True)
+    return {names[key]: round(weight / top, 4) for key, weight in ranked}
+
+
+def github_get(client: RevalidatingClient, url: str,
+               token_pool: Optional[GitHubTokenPool] = None) -> JSONResponse:
+    """GET a GitHub API URL, charging it to the token pool's budget when one is given.
+
+    Raises ``RateLimitExceeded`` when the pool is degraded.
+    """
+    if token_pool is None:
+        return client.get_json(url)
+    index = token_pool.acquire()
+    response = client.get_json(url, headers=token_pool.headers(index))
+    token_pool.record(index, response.status_code, response.headers)
+    return response
+
+
+def next_page_url(headers: Mapping[str, str]) -> Optional[str]:
+    """Return the rel="next" URL from a GitHub ``Link`` header, if any"""
+    match = _NEXT_LINK_RE.search(headers.get("Link", ""))
+    return match.group(1) if match else None
+
+
+def iter_repository_pages(client: RevalidatingClient, username: str,
+                          page_size: int = PAGE_SIZE,
+                          token_pool: Optional[GitHubTokenPool] = None) -> Iterator[List[Dict]]:
+    """Yield raw repository pages, most recently updated first, following ``Link`` headers.
+
+    Raises ``RuntimeError`` if a page cannot be fetched.
+    """
+    url = f"{GITHUB_API_URL}/users/{username}/repos?per_page={page_size}&sort=updated"
+    while url:
+        response = github_get(client, url, token_pool)
+        if not response.ok:
+            raise RuntimeError("Repositories not found")
+        yield response.data
+        url = next_page_url(response.headers)
+
+
+def fetch_repositories(client: RevalidatingClient, username: str,
+                       max_repos: int = MAX_REPOSITORIES,
+                       recent_days: int = RECENT_REPO_DAYS,
+                       token_pool: Optional[GitHubTokenPool] = None) -> List[Dict]:
+    """Stream repository pages into processed repos, stopping at max_repos.
+
+    With ``recent_days`` set, ingestion also stops at the first repo not updated
+    within that window; pages are sorted by update time, so nothing later qualifies.
+    """
+    cutoff = None
+    if recent_days:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=recent_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    processed_repos = []
+    pages = iter_repository_pages(client, username, page_size=min(PAGE_SIZE, max_repos), token_pool=token_pool)
+    for page in pages:
+        for repo in page:
+            # GitHub timestamps are fixed-width UTC ISO 8601, so string order is time order
+            if cutoff and (repo.get("updated_at") or "") < cutoff:
+                return processed_repos
+            processed_repos.append(process_repository(repo))
+            if len(processed_repos) >= max_repos:
+                return processed_repos
+    return processed_repos
+
+
+def process_user(username: str, user_data: Dict) -> Dict:
+    """Reduce a raw user object to the fields the pages use"""
+    return {
+        "name": user_data["name"] or username,
+        "bio": user_data["bio"] or "No bio available",
+        "public_repos": user_data["public_repos"],
+        "followers": user_data["followers"],
+        "following": user_data["following"],
+        "avatar_url": user_data["avatar_url"],
+        "location": user_data["location"],
+        "company": user_data["company"],
+        "blog": user_data["blog"]
+    }
+
+
+def fetch_github_profile(client: RevalidatingClient, username: str,
+                         max_repos: int = MAX_REPOSITORIES,
+                         recent_days: int = RECENT_REPO_DAYS,
+                         token_pool: Optional[GitHubTokenPool] = None) -> Dict:
+    """Fetch user data and repositories in parallel and return the processed payload.
+
+    Errors are reported as ``{"error": ...}`` rather than raised, matching what the
+    pages expect from ``fetch_github_data``.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="github-fetch") as pool:
+            user_future = pool.submit(github_get, client, f"{GITHUB_API_URL}/users/{username}", token_pool)
+            repos_future = pool.submit(fetch_repositories, client, username, max_repos, recent_days, token_pool)
+            user_response = user_future.result()
+            if user_response.status_code in (403, 429):
+                return {"error": "GitHub rate limit exceeded"}
+            if not user_response.ok:
+                return {"error": "User not found"}
+            try:
+                repositories = repos_future.result()
+            except RuntimeError as e:
+                return {"error": str(e)}
+
+        return {
+            "user": process_user(username, user_response.data),
+            "repositories": repositories
+        }
+    except RateLimitExceeded as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Failed to fetch GitHub data: {str(e)}"}
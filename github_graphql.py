@@ -0,0 +1,142 @@
+"""
+GitHub GraphQL backend
+
+Fetches a user's profile and repositories - including topics, stars and
+per-repository language byte counts - in one GraphQL query per page of
+repositories, instead of one REST call per repository for the extras.
+Returns the same processed structure as ``github_api.fetch_github_profile``;
+each repository additionally carries a ``languages`` mapping of language name
+to bytes. GraphQL requires an authenticated token.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from github_api import MAX_REPOSITORIES, PAGE_SIZE, RECENT_REPO_DAYS
+from github_ratelimit import GitHubTokenPool, RateLimitExceeded
+from http_client import RevalidatingClient
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+RATE_LIMIT_ERROR_TYPES = {"RATE_LIMITED", "RATE_LIMIT"}  # GraphQL error types reported for an exhausted budget
+
+PROFILE_QUERY = """
+query($login: String!, $first: Int!, $cursor: String) {
+  user(login: $login) {
+    name
+    bio
+    avatarUrl
+    location
+    company
+    websiteUrl
+    followers { totalCount }
+    following { totalCount }
+    repositories(first: $first, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        url
+        updatedAt
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+      }
+    }
+  }
+}
+"""
+
+
+def process_repository_node(node: Dict) -> Dict:
+    """Reduce a GraphQL repository node to the processed repository structure"""
+    return {
+        "name": node["name"],
+        "description": node["description"] or "No description available",
+        "language": (node.get("primaryLanguage") or {}).get("name") or "Unknown",
+        "stars": node["stargazerCount"],
+        "forks": node["forkCount"],
+        "updated_at": node["updatedAt"],
+        "html_url": node["url"],
+        "topics": [t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", [])],
+        "languages": {e["node"]["name"]: e["size"] for e in (node.get("languages") or {}).get("edges", [])}
+    }
+
+
+def fetch_github_profile_graphql(client: RevalidatingClient, username: str,
+                                 token_pool: GitHubTokenPool,
+                                 max_repos: int = MAX_REPOSITORIES,
+                                 recent_days: int = RECENT_REPO_DAYS) -> Dict:
+    """Fetch the processed profile through GraphQL, following repository cursors up to max_repos.
+
+    Errors are reported as ``{"error": ...}`` like the REST backend.
+    """
+    cutoff = None
+    if recent_days:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=recent_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    try:
+        user: Optional[Dict] = None
+        repositories = []
+        cursor = None
+        while True:
+            index = token_pool.acquire()
+            response = client.post_json(
+                GITHUB_GRAPHQL_URL,
+                {"query": PROFILE_QUERY,
+                 "variables": {"login": username, "first": min(PAGE_SIZE, max_repos), "cursor": cursor}},
+                headers=token_pool.headers(index)
+            )
+            # GraphQL reports most failures, rate limits included, as "errors" in a 200 reply
+            errors = ((response.data or {}).get("errors") or []) if response.ok else []
+            rate_limited = any(error.get("type") in RATE_LIMIT_ERROR_TYPES for error in errors)
+            token_pool.record(index, response.status_code, response.headers, rate_limited=rate_limited)
+            if response.status_code in (403, 429) or rate_limited:
+                return {"error": "GitHub rate limit exceeded"}
+            if not response.ok:
+                return {"error": f"GitHub GraphQL request failed ({response.status_code})"}
+
+            user_node = (response.data.get("data") or {}).get("user")
+            if user_node is None:
+                if any(error.get("type") == "NOT_FOUND" for error in errors) or not errors:
+                    return {"error": "User not found"}
+                return {"error": "GitHub GraphQL query failed: "
+                                 + "; ".join(error.get("message", "unknown error") for error in errors)}
+            if user is None:
+                user = user_node
+
+            repo_page = user_node["repositories"]
+            for node in repo_page["nodes"]:
+                # GitHub timestamps are fixed-width UTC ISO 8601, so string order is time order
+                if cutoff and node["updatedAt"] < cutoff:
+                    break
+                repositories.append(process_repository_node(node))
+                if len(repositories) >= max_repos:
+                    break
+            else:
+                if repo_page["pageInfo"]["hasNextPage"]:
+                    cursor = repo_page["pageInfo"]["endCursor"]
+                    continue
+            break
+
+        return {
+            "user": {
+                "name": user["name"] or username,
+                "bio": user["bio"] or "No bio available",
+                "public_repos": user["repositories"]["totalCount"],
+                "followers": user["followers"]["totalCount"],
+                "following": user["following"]["totalCount"],
+                "avatar_url": user["avatarUrl"],
+                "location": user["location"],
+                "company": user["company"],
+                "blog": user["websiteUrl"] or ""
+            },
+            "repositories": repositories
+        }
+    except RateLimitExceeded as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Failed to fetch GitHub data: {str(e)}"}
@@ -0,0 +1,119 @@
+"""
+GitHub rate-limit budget tracking
+
+Every GitHub response carries ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset``.
+The token pool records them per token, hands out tokens round-robin, and
+switches to a degraded "serve snapshot only" mode once every token is down to
+its reserve, so the last calls of a window are never spent on routine refreshes.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Mapping, Optional
+
+DEGRADED_RESERVE = int(os.environ.get("GITHUB_RATE_LIMIT_RESERVE", "10"))  # calls kept back per token
+RATE_LIMITED_BACKOFF = 60  # seconds a token rests after a rate-limit reply without reset information
+
+
+class RateLimitExceeded(Exception):
+    """Raised when no token has budget left above the reserve"""
+
+
+class GitHubTokenPool:
+    """Round-robin pool of GitHub tokens with per-token rate-limit budgets.
+
+    A pool without tokens tracks the single unauthenticated budget (60 requests/hour).
+    """
+
+    def __init__(self, tokens: Optional[List[str]] = None, reserve: int = DEGRADED_RESERVE):
+        self.tokens: List[Optional[str]] = list(tokens) if tokens else [None]
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._cursor = 0
+        self._budgets: Dict[int, Dict] = {
+            index: {"limit": None, "remaining": None, "reset_at": 0.0} for index in range(len(self.tokens))
+        }
+
+    @classmethod
+    def from_env(cls) -> "GitHubTokenPool":
+        """Build a pool from GITHUB_TOKENS (comma-separated) or GITHUB_TOKEN"""
+        raw = os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_TOKEN") or ""
+        return cls([token.strip() for token in raw.split(",") if token.strip()])
+
+    @property
+    def authenticated(self) -> bool:
+        """True when the pool holds at least one token"""
+        return any(self.tokens)
+
+    def _available(self, budget: Dict, now: float) -> bool:
+        if budget["remaining"] is None or now >= budget["reset_at"]:
+            return True  # Unknown yet, or the window has reset
+        return budget["remaining"] > self.reserve
+
+    def acquire(self) -> int:
+        """Return the index of the next token with budget to spare.
+
+        Raises ``RateLimitExceeded`` when the pool is degraded.
+        """
+        now = time.time()
+        with self._lock:
+            for offset in range(len(self.tokens)):
+                index = (self._cursor + offset) % len(self.tokens)
+                if self._available(self._budgets[index], now):
+                    self._cursor = (index + 1) % len(self.tokens)
+                    return index
+        raise RateLimitExceeded("GitHub rate limit budget exhausted; serving cached data")
+
+    def headers(self, index: int) -> Dict[str, str]:
+        """Request headers authenticating as the token at index"""
+        headers = {"Accept": "application/vnd.github+json"}
+        token = self.tokens[index]
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    def record(self, index: int, status_code: int, response_headers: Mapping[str, str],
+               rate_limited: bool = False) -> None:
+        """Update a token's budget from the rate-limit headers of a response.
+
+        ``rate_limited`` marks a reply that reported a rate limit in its body, as
+        GraphQL does with a 200 status; the token is then treated as empty.
+        """
+        now = time.time()
+        with self._lock:
+            budget = self._budgets[index]
+            remaining = response_headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                budget["remaining"] = int(remaining)
+                budget["limit"] = int(response_headers.get("X-RateLimit-Limit", budget["limit"] or 0))
+                budget["reset_at"] = float(response_headers.get("X-RateLimit-Reset", now + 3600))
+            retry_after = response_headers.get("Retry-After")
+            if status_code in (403, 429) and retry_after is not None:
+                # Secondary rate limit: treat the token as empty until GitHub says otherwise
+                budget["remaining"] = 0
+                budget["reset_at"] = max(budget["reset_at"], now + float(retry_after))
+            elif rate_limited:
+                budget["remaining"] = 0
+                if budget["reset_at"] <= now:
+                    budget["reset_at"] = now + float(retry_after or RATE_LIMITED_BACKOFF)
+
+    @property
+    def degraded(self) -> bool:
+        """True when every token is down to its reserve"""
+        now = time.time()
+        with self._lock:
+            return not any(self._available(budget, now) for budget in self._budgets.values())
+
+    def status(self) -> Dict:
+        """Budget state for reporting: totals across the pool plus the degraded flag"""
+        now = time.time()
+        with self._lock:
+            known = [b for b in self._budgets.values() if b["remaining"] is not None and now < b["reset_at"]]
+            return {
+                "tokens": len(self.tokens),
+                "remaining": sum(b["remaining"] for b in known) if known else None,
+                "limit": sum(b["limit"] or 0 for b in known) if known else None,
+                "reset_at": min(b["reset_at"] for b in known) if known else None,
+                "degraded": bool(known) and not any(self._available(b, now) for b in self._budgets.values())
+            }
@@ -0,0 +1,65 @@
+"""
+Persistent GitHub snapshot store
+
+Keeps the last good GitHub payload per key in a small SQLite database so that
+pages render from disk straight after a restart. Renewing the snapshots is up
+to the caller (``GitHubProfileService`` does it on its background refresher).
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Callable, ContextManager, Dict, Optional
+
+from sqlite_db import connect, prepare_database
+
+SNAPSHOT_DB_PATH = os.environ.get(
+    "GITHUB_SNAPSHOT_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "github_snapshots.sqlite3")
+)
+
+
+class GitHubSnapshotStore:
+    """SQLite-backed store of the last good GitHub payload for each key"""
+
+    def __init__(self, path: str = SNAPSHOT_DB_PATH):
+        self.path = path
+        prepare_database(path, [
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL)",
+        ])
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return connect(self.path)
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Return ``{"payload": ..., "fetched_at": ...}`` for a key, or None if missing"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, fetched_at FROM snapshots WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return {"payload": json.loads(row[0]), "fetched_at": row[1]}
+
+    def save(self, key: str, payload: Dict, fetched_at: Optional[float] = None) -> None:
+        """Persist a payload as the latest good snapshot for a key"""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (key, payload, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(payload), fetched_at)
+            )
+
+    def refresh(self, key: str, fetch: Callable[[], Dict]) -> Dict:
+        """Fetch a fresh payload and store it unless the fetch reported an error"""
+        payload = fetch()
+        if isinstance(payload, dict) and "error" not in payload:
+            self.save(key, payload)
+        return payload
@@ -0,0 +1,153 @@
+"""
+Shared HTTP client for outbound calls
+
+One pooled keep-alive session with connect/read timeouts, a per-host
+concurrency limit and jittered exponential backoff, so a slow upstream cannot
+stall a script run indefinitely.
+
+The client also remembers the ETag / Last-Modified validators and the parsed
+JSON body for recently fetched URLs, and sends conditional requests so a 304
+Not Modified reuses the stored payload without downloading or re-parsing the
+body. Entries are keyed by URL and Authorization header, since GitHub replies
+differ per token, and the least recently used ones are evicted past
+``MAX_CACHED_RESPONSES``.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10.0)  # (connect, read) seconds
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.25  # seconds; doubled on every attempt
+BACKOFF_CAP = 2.0
+MAX_CONNECTIONS_PER_HOST = 8
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_CACHED_RESPONSES = 512  # JSON bodies kept for revalidation
+
+
+@dataclass
+class JSONResponse:
+    """Outcome of a JSON GET request"""
+    status_code: int
+    data: Any = None
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    not_modified: bool = False  # True when the payload came from a 304 revalidation
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+
+class RevalidatingClient:
+    """Pooled HTTP client that revalidates cached JSON payloads with conditional requests"""
+
+    def __init__(self,
+                 timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+                 max_retries: int = MAX_RETRIES,
+                 max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+                 max_cached_responses: int = MAX_CACHED_RESPONSES):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_connections_per_host = max_connections_per_host
+        self.max_cached_responses = max_cached_responses
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Dict]" = OrderedDict()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_connections_per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: spreads retries from concurrent sessions apart
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                json: Any = None) -> requests.Response:
+        """Send a request through the pooled session, retrying connection errors and 429/5xx responses.
+
+        Raises ``requests.RequestException`` once the retries are exhausted.
+        """
+        slot = self._host_slot(url)
+        attempt = 0
+        while True:
+            try:
+                with slot:
+                    response = self.session.request(method, url, headers=headers, json=json, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET through the pooled session with timeouts and retries"""
+        return self.request("GET", url, headers=headers)
+
+    def post_json(self, url: str, payload: Any, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+        """POST a JSON body and return the parsed JSON reply (no revalidation)"""
+        response = self.request("POST", url, headers=headers, json=payload)
+        if response.status_code != 200:
+            return JSONResponse(response.status_code, None, response.headers)
+        return JSONResponse(200, response.json(), response.headers)
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+        """GET a JSON document, sending If-None-Match / If-Modified-Since when we hold a copy"""
+        request_headers = dict(headers or {})
+        key = (url, CaseInsensitiveDict(request_headers).get("Authorization"))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.get(url, headers=request_headers)
+
+        if response.status_code == 304 and entry:
+            # A 304 may omit headers such as Link, so start from the ones stored with the body
+            merged_headers = CaseInsensitiveDict(entry["headers"])
+            merged_headers.update(response.headers)
+            return JSONResponse(200, entry["data"], merged_headers, not_modified=True)
+        if response.status_code != 200:
+            return JSONResponse(response.status_code, None, response.headers)
+
+        data = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                self._entries[key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "data": data,
+                    "headers": CaseInsensitiveDict(response.headers)
+                }
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_cached_responses:
+                    self._entries.popitem(last=False)  # Least recently used
+        return JSONResponse(200, data, response.headers)
@@ -0,0 +1,112 @@
+"""
+Near-duplicate job detection with MinHash and locality-sensitive hashing
+
+Boards re-post the same role with slightly different wording, so exact
+fingerprints miss them. Each posting's title, company and description are cut
+into word shingles and summarised by a MinHash signature, whose agreement with
+another signature estimates the Jaccard similarity of the two shingle sets.
+Signatures are split into bands and hashed into buckets; only postings sharing
+a bucket are compared, so checking a new posting costs a few dictionary
+lookups rather than a scan of the corpus.
+"""
+
+import re
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+SHINGLE_SIZE = 3  # words per shingle
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16  # 16 bands of 4 rows: pairs around 0.5 similarity or more usually share a bucket
+NEAR_DUPLICATE_THRESHOLD = 0.8  # estimated Jaccard similarity at which two postings are the same role
+MIN_SHINGLES = 5  # postings with less text than this are never treated as near-duplicates
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures stay comparable across processes and restarts
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, _MAX_HASH, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.randint(0, _MAX_HASH, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def shingles(job: Dict) -> Set[int]:
+    """32-bit hashes of the word shingles of a posting's title, company and description"""
+    text = " ".join(str(job.get(field) or "") for field in ("title", "company", "description"))
+    words = _WORD_RE.findall(text.lower())
+    return {
+        zlib.crc32(" ".join(words[start:start + SHINGLE_SIZE]).encode("utf-8"))
+        for start in range(max(len(words) - SHINGLE_SIZE + 1, 0))
+    }
+
+
+def minhash(shingle_hashes: Set[int]) -> np.ndarray:
+    """MinHash signature of a shingle set: the minimum of each permuted hash"""
+    values = np.fromiter(shingle_hashes, dtype=np.uint64, count=len(shingle_hashes))
+    # (a * x + b) mod p: a, b and x are all below 2**32, so the sum never overflows uint64
+    permuted = (np.outer(_PERM_A, values) + _PERM_B[:, None]) % np.uint64(_PRIME) & np.uint64(_MAX_HASH)
+    return permuted.min(axis=1)
+
+
+class NearDuplicateIndex:
+    """LSH buckets over MinHash signatures, mapping postings to the first posting they duplicate"""
+
+    def __init__(self, bands: int = LSH_BANDS, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.rows = NUM_PERMUTATIONS // bands
+        self.bands = bands
+        self.threshold = threshold
+        self.signatures: Dict[str, np.ndarray] = {}
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    @staticmethod
+    def signature(job: Dict) -> Optional[np.ndarray]:
+        """Signature of a posting, or None when it has too little text to compare"""
+        shingle_hashes = shingles(job)
+        return minhash(shingle_hashes) if len(shingle_hashes) >= MIN_SHINGLES else None
+
+    def find(self, job: Dict, exclude: Optional[str] = None) -> Optional[str]:
+        """Key of the most similar indexed posting at or above the threshold, if any"""
+        signature = self.signature(job)
+        if signature is None:
+            return None
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates |= self._buckets.get(band_key, set())
+        candidates.discard(exclude)
+
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = float(np.mean(self.signatures[key] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = key, similarity
+        return best
+
+    def add(self, key: str, job: Dict) -> None:
+        """Index a posting under key, replacing any earlier signature for it"""
+        self.remove(key)
+        signature = self.signature(job)
+        if signature is None:
+            return
+        self.signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        """Forget a posting"""
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
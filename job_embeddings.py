@@ -0,0 +1,191 @@
+"""
+Local semantic embeddings for job matching
+
+A CPU-only alternative to exact skill matching. Job postings are embedded with
+TF-IDF followed by a truncated SVD (latent semantic analysis), computed in NumPy
+with a randomized SVD over a sparse TF-IDF matrix. Terms that co-occur across
+postings ("pytorch", "deep learning", "neural") end up close together, so a
+profile can match a posting without sharing its exact words.
+
+Embeddings are unit vectors searched by cosine similarity. Small corpora are
+scanned flat; larger ones use an IVF index (spherical k-means lists), which
+only compares the query with the postings in its nearest few lists.
+"""
+
+import math
+from collections import Counter
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from job_index import tokenize
+
+SEMANTIC_DIMENSIONS = 64
+MAX_FEATURES = 8192  # most common terms kept in the TF-IDF vocabulary
+IVF_MIN_VECTORS = 1024  # below this, a flat scan is as cheap as probing lists
+IVF_PROBES = 4  # lists searched per query
+KMEANS_ITERATIONS = 10
+
+_SVD_OVERSAMPLES = 10
+_SVD_POWER_ITERATIONS = 1
+_CHUNK_ROWS = 4096  # rows per block in sparse products, bounding temporary memory (float32 throughout)
+
+
+class SparseRows:
+    """Minimal CSR matrix with the two dense products the randomized SVD needs"""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, n_columns: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = (len(indptr) - 1, n_columns)
+        self._transposed: Optional["SparseRows"] = None
+
+    @property
+    def T(self) -> "SparseRows":
+        """The transposed matrix (built once)"""
+        if self._transposed is None:
+            rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+            order = np.argsort(self.indices, kind="stable")
+            indptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices, minlength=self.shape[1]))])
+            self._transposed = SparseRows(indptr, rows[order], self.data[order], self.shape[0])
+            self._transposed._transposed = self
+        return self._transposed
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """self @ dense"""
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=np.float32)
+        dense = dense.astype(np.float32, copy=False)
+        for start in range(0, self.shape[0], _CHUNK_ROWS):
+            stop = min(start + _CHUNK_ROWS, self.shape[0])
+            lo, hi = self.indptr[start], self.indptr[stop]
+            if lo == hi:
+                continue
+            products = self.data[lo:hi, None] * dense[self.indices[lo:hi]]
+            # Sum each row's products; empty rows have no segment of their own and stay zero
+            nonempty = np.diff(self.indptr[start:stop + 1]) > 0
+            out[start:stop][nonempty] = np.add.reduceat(products, self.indptr[start:stop][nonempty] - lo)
+        return out
+
+    def tdot(self, dense: np.ndarray) -> np.ndarray:
+        """self.T @ dense"""
+        return self.T.dot(dense)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def randomized_svd_components(matrix: SparseRows, dimensions: int, seed: int = 0) -> np.ndarray:
+    """Top right singular vectors (dimensions x columns) of a sparse matrix (Halko et al.)"""
+    rank = min(dimensions + _SVD_OVERSAMPLES, *matrix.shape)
+    if rank == 0:
+        return np.zeros((0, matrix.shape[1]))
+    rng = np.random.RandomState(seed)
+    sample = matrix.dot(rng.standard_normal((matrix.shape[1], rank)).astype(np.float32))
+    for _ in range(_SVD_POWER_ITERATIONS):
+        sample, _ = np.linalg.qr(sample)
+        projected, _ = np.linalg.qr(matrix.tdot(sample))
+        sample = matrix.dot(projected)
+    basis, _ = np.linalg.qr(sample)
+    _, _, components = np.linalg.svd(matrix.tdot(basis).T, full_matrices=False)
+    return components[:dimensions]
+
+
+class TfidfSvdEmbedder:
+    """TF-IDF over a document corpus, projected onto its leading SVD components"""
+
+    def __init__(self, documents: Sequence[str], dimensions: int = SEMANTIC_DIMENSIONS,
+                 max_features: int = MAX_FEATURES):
+        token_lists = [tokenize(document) for document in documents]
+        document_frequency = Counter(token for tokens in token_lists for token in set(tokens))
+        terms = [term for term, _ in document_frequency.most_common(max_features)]
+        self.vocabulary = {term: column for column, term in enumerate(terms)}
+        frequencies = np.array([document_frequency[term] for term in terms], dtype=float)
+        self.idf = np.log((1 + len(documents)) / (1 + frequencies)) + 1
+
+        matrix = self._tfidf(token_lists)
+        self.components = randomized_svd_components(matrix, dimensions)
+        self.embeddings = _normalize_rows(matrix.dot(self.components.T))
+
+    def _weights(self, tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        counts = Counter(token for token in tokens if token in self.vocabulary)
+        columns = np.fromiter((self.vocabulary[token] for token in counts), dtype=np.int64, count=len(counts))
+        values = (1 + np.log(np.fromiter(counts.values(), dtype=float, count=len(counts)))) * self.idf[columns]
+        norm = np.linalg.norm(values)
+        return columns, values / norm if norm else values
+
+    def _tfidf(self, token_lists: List[List[str]]) -> SparseRows:
+        indptr, indices, data = [0], [], []
+        for tokens in token_lists:
+            columns, values = self._weights(tokens)
+            indices.append(columns)
+            data.append(values)
+            indptr.append(indptr[-1] + len(columns))
+        return SparseRows(np.array(indptr, dtype=np.int64),
+                          np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+                          np.concatenate(data).astype(np.float32) if data else np.zeros(0, dtype=np.float32),
+                          len(self.vocabulary))
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit embedding of a query text (zeros when it shares no term with the corpus)"""
+        columns, values = self._weights(tokenize(text))
+        return _normalize_rows(values @ self.components[:, columns].T)
+
+
+class IVFIndex:
+    """Inverted-file index over unit vectors; falls back to a flat scan for small corpora"""
+
+    def __init__(self, vectors: np.ndarray, n_probe: int = IVF_PROBES, seed: int = 0):
+        self.vectors = vectors
+        self.n_probe = n_probe
+        self.centroids: Optional[np.ndarray] = None
+        if len(vectors) < IVF_MIN_VECTORS:
+            return
+
+        rng = np.random.RandomState(seed)
+        n_lists = int(math.sqrt(len(vectors)))
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, vectors)
+            # Empty lists keep their previous centroid
+            centroids = np.where(np.linalg.norm(sums, axis=1, keepdims=True) > 0, _normalize_rows(sums), centroids)
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        self.centroids = centroids
+        self._order = np.argsort(assignment, kind="stable")
+        self._offsets = np.searchsorted(assignment[self._order], np.arange(n_lists + 1))
+
+    def search(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions of the vectors in the probed lists (all of them when flat) and their cosine similarity"""
+        if self.centroids is None:
+            return np.arange(len(self.vectors)), self.vectors @ query
+        n_probe = min(self.n_probe, len(self.centroids))
+        probed = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        positions = np.sort(np.concatenate([self._order[self._offsets[c]:self._offsets[c + 1]] for c in probed]))
+        return positions, self.vectors[positions] @ query
+
+
+def job_document(job: Mapping) -> str:
+    """Text embedded for a posting: title, skills and description"""
+    return " ".join([str(job.get("title") or ""), " ".join(job.get("skills") or ()), str(job.get("description") or "")])
+
+
+class SemanticJobIndex:
+    """Embeddings of a list of jobs with an ANN index, scored against free-text profiles"""
+
+    def __init__(self, jobs: Sequence[Mapping], dimensions: int = SEMANTIC_DIMENSIONS):
+        self.embedder = TfidfSvdEmbedder([job_document(job) for job in jobs], dimensions)
+        self.index = IVFIndex(self.embedder.embeddings)
+
+    def __len__(self) -> int:
+        return len(self.embedder.embeddings)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity x 100 per job; -inf for jobs outside the probed lists"""
+        scores = np.full(len(self), -np.inf)
+        positions, similarities = self.index.search(self.embedder.embed(text))
+        scores[positions] = np.maximum(similarities, 0.0) * 100
+        return scores
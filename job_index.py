@@ -0,0 +1,354 @@
+"""
+Inverted index over job postings
+
+Each posting's title, description, skills and company are tokenized once when
+the index is built. A search then looks up posting lists and combines them with
+set operations: the tokens of one keyword are intersected, and the keywords are
+unioned. Search cost therefore depends on the posting lists touched, not on the
+size of the corpus.
+
+Matches are ranked with BM25 over the same fields, with field boosts so a hit
+in the title outweighs one in the description. Boosted term frequencies and
+document lengths are stored as NumPy arrays at build time, so scoring a query
+is one vectorized pass per query term.
+
+Synonyms come from a declarative table. It is compiled into an alias lookup,
+and at build time every alias found in a posting (as whole tokens) adds the
+posting to a concept term. A query keyword that is a known alias then costs
+one dictionary lookup and one posting list, instead of a rescan of the text.
+Inflections are listed in the table explicitly, so "data" does not pull in
+every posting that mentions a database.
+
+A query word also matches its regular inflections from ``QUERY_SUFFIXES``
+("engineer" finds "engineers"), never arbitrary longer words ("java" does not
+find "javascript").
+
+The index is updated in place: ``sync`` asks ``JobStore`` for the postings
+that differ from the content hashes the index holds and only tokenizes those.
+Job ids stay stable across updates; a removed posting leaves an empty slot behind.
+Postings are held as immutable ``JobRecord`` objects, so callers can share them
+without copying.
+"""
+
+import math
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from job_record import JobRecord
+from job_store import JobDelta, JobStore
+from job_table import JobTable
+
+INDEXED_FIELDS = ("title", "description", "skills", "company")
+FIELD_BOOSTS = {"title": 3.0, "skills": 2.0, "description": 1.0, "company": 0.5}
+MIN_STEM_LENGTH = 3  # shorter query tokens ("ai", "ml") only match themselves
+QUERY_SUFFIXES = ("s", "es", "ed", "ing", "er", "ers")  # inflections a query word also matches
+BM25_K1 = 1.2
+BM25_B = 0.75
+SYNONYM_WEIGHT = 0.5  # related terms count for less than the words actually searched
+CONCEPT_PREFIX = "~"  # concept terms can never collide with tokens, which start with [a-z0-9]
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# Concept -> aliases. Searching for any alias also matches postings that mention another alias.
+JOB_SYNONYMS: Dict[str, List[str]] = {
+    "artificial intelligence": ["ai", "artificial intelligence", "machine learning", "ml"],
+    "software engineering": ["software", "developer", "developers", "engineer", "engineers",
+                             "engineering", "development"],
+    "data": ["data", "analyst", "analysts", "scientist", "scientists", "analytics"],
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping names like "c++", "c#" and "node.js" intact"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def compile_synonyms(table: Dict[str, List[str]]) -> Dict[Tuple[str, ...], str]:
+    """Map each alias (as a token tuple) to its concept term"""
+    aliases = {}
+    for concept, phrases in table.items():
+        for phrase in phrases:
+            tokens = tuple(tokenize(phrase))
+            if tokens:
+                aliases[tokens] = CONCEPT_PREFIX + concept
+    return aliases
+
+
+def job_text(job: Dict, field: str) -> str:
+    """Text of one indexed field of a job posting"""
+    value = job.get(field) or ""
+    return " ".join(value) if isinstance(value, (list, tuple)) else str(value)
+
+
+class JobIndex:
+    """Inverted index from tokens to the ids (positions) of the jobs containing them"""
+
+    def __init__(self, jobs: Iterable[Dict] = (), synonyms: Optional[Dict[str, List[str]]] = None):
+        self.jobs: List[Optional[JobRecord]] = []  # None marks the slot of a removed posting
+        self.ids: Dict[str, int] = {}  # fingerprint -> job id, for postings ingested through JobStore
+        self.content_hashes: Dict[str, str] = {}  # fingerprint -> content hash of the indexed version
+        self.table = JobTable()  # Columnar attributes for the search filters
+        self.aliases = compile_synonyms(JOB_SYNONYMS if synonyms is None else synonyms)
+        self._alias_lengths = sorted({len(alias) for alias in self.aliases})
+        self.postings: Dict[str, Set[int]] = {}
+        self._term_freqs: Dict[str, Dict[int, float]] = {}
+        self._doc_terms: List[Dict[str, float]] = []
+        self._doc_lengths: List[float] = []
+        # Per-term BM25 statistics (posting ids with their boosted term frequencies),
+        # built on first use and dropped whenever the term's postings change
+        self.term_stats: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._length_norm = np.zeros(0)
+        self._lengths_dirty = False
+        self._live = 0
+        self.version = 0  # Bumped on every change, so callers can key caches by corpus state
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()  # One sync at a time, so ingests and applies never interleave
+        self.add(jobs)
+
+    def _analyze(self, job: Dict) -> Tuple[Dict[str, float], float]:
+        """Boosted term frequencies (concept terms included) and boosted length of a posting"""
+        freqs: Dict[str, float] = {}
+        length = 0.0
+        for field in INDEXED_FIELDS:
+            boost = FIELD_BOOSTS[field]
+            tokens = tokenize(job_text(job, field))
+            length += boost * len(tokens)
+            terms = list(tokens)
+            # Bake synonyms in: every alias occurrence also counts towards its concept term
+            for alias_length in self._alias_lengths:
+                for start in range(len(tokens) - alias_length + 1):
+                    concept = self.aliases.get(tuple(tokens[start:start + alias_length]))
+                    if concept:
+                        terms.append(concept)
+            for term in terms:
+                freqs[term] = freqs.get(term, 0.0) + boost
+        return freqs, length
+
+    def _index(self, job_id: int, job: JobRecord) -> None:
+        freqs, length = self._analyze(job)
+        self.jobs[job_id] = job
+        self.table.set_row(job_id, job)
+        self._doc_terms[job_id] = freqs
+        self._doc_lengths[job_id] = length
+        for term, freq in freqs.items():
+            if term not in self.postings:
+                self.postings[term] = set()
+                self._term_freqs[term] = {}
+            self.postings[term].add(job_id)
+            self._term_freqs[term][job_id] = freq
+            self.term_stats.pop(term, None)
+        self._lengths_dirty = True
+        self.version += 1
+
+    def _unindex(self, job_id: int) -> None:
+        for term in self._doc_terms[job_id]:
+            self.postings[term].discard(job_id)
+            del self._term_freqs[term][job_id]
+            self.term_stats.pop(term, None)
+            if not self.postings[term]:
+                del self.postings[term]
+                del self._term_freqs[term]
+        self._doc_terms[job_id] = {}
+        self._doc_lengths[job_id] = 0.0
+        self._lengths_dirty = True
+
+    def add(self, jobs: Iterable[Dict]) -> List[int]:
+        """Index new postings and return their ids; a known fingerprint updates that posting instead"""
+        job_ids = []
+        with self._lock:
+            for job in jobs:
+                job = JobRecord.from_mapping(job)
+                fingerprint = job.fingerprint
+                if fingerprint in self.ids:
+                    self.update(self.ids[fingerprint], job)
+                    job_ids.append(self.ids[fingerprint])
+                    continue
+                job_id = len(self.jobs)
+                self.jobs.append(None)
+                self._doc_terms.append({})
+                self._doc_lengths.append(0.0)
+                self._index(job_id, job)
+                self._live += 1
+                if fingerprint:
+                    self.ids[fingerprint] = job_id
+                job_ids.append(job_id)
+        return job_ids
+
+    def update(self, job_id: int, job: Dict) -> None:
+        """Re-index a changed posting under its existing id"""
+        with self._lock:
+            self._unindex(job_id)
+            self._index(job_id, JobRecord.from_mapping(job))
+
+    def remove(self, job_ids: Iterable[int]) -> None:
+        """Drop postings from the index, leaving their ids unused"""
+        with self._lock:
+            for job_id in job_ids:
+                job = self.jobs[job_id]
+                if job is None:
+                    continue
+                self._unindex(job_id)
+                self.table.remove(job_id)
+                self.jobs[job_id] = None
+                self.ids.pop(job.fingerprint, None)
+                self.content_hashes.pop(job.fingerprint, None)
+                self._live -= 1
+                self.version += 1
+
+    def apply(self, delta: JobDelta) -> None:
+        """Patch the index with a ``JobStore`` delta"""
+        with self._lock:
+            self.remove([self.ids[fingerprint] for fingerprint in delta.removed if fingerprint in self.ids])
+            self.add(list(delta.updated.values()) + list(delta.added.values()))
+            self.content_hashes.update(delta.hashes)
+
+    def sync(self, store: JobStore, jobs: Optional[Iterable[Dict]] = None) -> None:
+        """Ingest freshly loaded postings (if given), then bring the index level with the store.
+
+        The delta is taken against the hashes this index holds rather than the
+        ingest's own, so postings ingested or expired by another process sharing
+        the store are picked up too.
+        """
+        with self._sync_lock:
+            if jobs is not None:
+                store.ingest(jobs)
+            with self._lock:
+                known = dict(self.content_hashes)
+            self.apply(store.delta_since(known))
+
+    def _stats(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        if term not in self.term_stats:
+            freqs = self._term_freqs[term]
+            self.term_stats[term] = (np.fromiter(freqs.keys(), dtype=np.int64, count=len(freqs)),
+                                     np.fromiter(freqs.values(), dtype=float, count=len(freqs)))
+        return self.term_stats[term]
+
+    def _norms(self) -> np.ndarray:
+        if self._lengths_dirty:
+            doc_lengths = np.array(self._doc_lengths, dtype=float)
+            average_length = doc_lengths.sum() / self._live if self._live else 1.0
+            # Length normalisation is query-independent, so fold it in once per corpus change
+            self._length_norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths / (average_length or 1.0))
+            self._lengths_dirty = False
+        return self._length_norm
+
+    def __len__(self) -> int:
+        return self._live
+
+    def _expand_token(self, token: str) -> List[str]:
+        """Indexed terms a query token matches: itself, plus its inflections if 3+ characters"""
+        candidates = [token]
+        if len(token) >= MIN_STEM_LENGTH:
+            candidates.extend(token + suffix for suffix in QUERY_SUFFIXES)
+        return [term for term in candidates if term in self.postings]
+
+    def _token_postings(self, token: str) -> Set[int]:
+        """Jobs containing the token or, for tokens of 3+ characters, one of its inflections"""
+        matches: Set[int] = set()
+        for term in self._expand_token(token):
+            matches |= self.postings[term]
+        return matches
+
+    def _phrase_postings(self, phrase: str) -> Set[int]:
+        """Jobs containing every token of a phrase"""
+        tokens = tokenize(phrase)
+        if not tokens:
+            return set()
+        result = self._token_postings(tokens[0])
+        for token in tokens[1:]:
+            if not result:
+                break
+            result = result & self._token_postings(token)
+        return result
+
+    def _parse_query(self, keywords: Iterable[str]) -> List[Tuple[List[str], Optional[str]]]:
+        """Tokens of each non-empty keyword, with the concept term it is an alias of (if any)"""
+        parsed = []
+        for keyword in keywords:
+            tokens = tokenize(keyword or "")
+            if tokens:
+                parsed.append((tokens, self.aliases.get(tuple(tokens))))
+        return parsed
+
+    def search(self, keywords: Iterable[str]) -> List[int]:
+        """Ids of jobs matching any keyword (or all jobs when no keyword is given), in corpus order"""
+        parsed = self._parse_query(keywords)
+        with self._lock:
+            if not parsed:
+                return [job_id for job_id, job in enumerate(self.jobs) if job is not None]
+
+            matches: Set[int] = set()
+            for tokens, concept in parsed:
+                matches |= self._phrase_postings(" ".join(tokens))
+                if concept:
+                    matches |= self.postings.get(concept, set())
+            return sorted(matches)
+
+    def scores(self, keywords: Iterable[str]) -> np.ndarray:
+        """BM25 score of every job for the keywords (zeros when no keyword is given)"""
+        parsed = self._parse_query(keywords)
+        with self._lock:
+            scores = np.zeros(len(self.jobs))
+            query_terms: Dict[str, float] = {}
+            for tokens, concept in parsed:
+                for token in tokens:
+                    for term in self._expand_token(token):
+                        query_terms[term] = 1.0
+                if concept in self.postings:
+                    query_terms.setdefault(concept, SYNONYM_WEIGHT)
+
+            length_norm = self._norms()
+            for term, weight in query_terms.items():
+                ids, freqs = self._stats(term)
+                idf = math.log(1 + (self._live - len(ids) + 0.5) / (len(ids) + 0.5))
+                scores[ids] += weight * idf * freqs * (BM25_K1 + 1) / (freqs + length_norm[ids])
+            return scores
+
+    def query(self, keywords: Iterable[str], location: str = "Any", experience_level: str = "All",
+              job_type: str = "All", visa_sponsorship: str = "Any") -> Tuple[List[Tuple[int, JobRecord]], np.ndarray]:
+        """Matching ``(job id, job)`` pairs that pass the filters, with the BM25 score of every job id.
+
+        Reads the postings, filters and scores under one lock, so a concurrent
+        ``apply`` can never leave them out of step.
+        """
+        keywords = list(keywords)
+        with self._lock:
+            mask = self.table.filter_mask(location, experience_level, job_type, visa_sponsorship)
+            matches = [(job_id, self.jobs[job_id]) for job_id in self.search(keywords) if mask[job_id]]
+            return matches, self.scores(keywords)
+
+    def live_jobs(self) -> List[Tuple[int, JobRecord]]:
+        """``(job id, job)`` pairs of every posting currently in the index"""
+        with self._lock:
+            return [(job_id, job) for job_id, job in enumerate(self.jobs) if job is not None]
+
+    def keyword_mask(self, keywords: Iterable[str]) -> np.ndarray:
+        """Boolean mask over job ids of the postings matching the keywords"""
+        with self._lock:
+            mask = np.zeros(len(self.jobs), dtype=bool)
+            mask[self.search(keywords)] = True
+            return mask
+
+    def facets(self, keywords: Iterable[str], location: str = "Any", experience_level: str = "All",
+               job_type: str = "All", visa_sponsorship: str = "Any",
+               options: Optional[Dict[str, List[str]]] = None) -> Dict[str, Dict]:
+        """Facet counts of a search, read atomically like ``query``.
+
+        Returns ``{"values": ..., "options": ..., "salary": ...}``: counts per facet
+        value among the filtered results (see ``JobTable.facet_counts``), the result
+        count each filter option would give (for the filters named in options), and
+        salary statistics of the results.
+        """
+        selected = {"location": location, "experience_level": experience_level,
+                    "job_type": job_type, "visa_sponsorship": visa_sponsorship}
+        with self._lock:
+            matched = self.keyword_mask(keywords)
+            results = matched & self.table.filter_mask(location, experience_level, job_type, visa_sponsorship)
+            return {
+                "values": self.table.facet_counts(results),
+                "options": self.table.option_counts(matched, selected, options or {}),
+                "salary": self.table.salary_stats(results),
+            }
@@ -0,0 +1,92 @@
+"""
+Ingest-time normalization of job postings
+
+Job boards describe dates and pay as free text ("3 days ago",
+"KES 1,500,000 - KES 2,500,000", "$25 - $40/hour"). ``normalize_job`` parses
+them once, when a posting is ingested, into typed fields next to the original
+text:
+
+- ``posted_at``: Unix timestamp of the posting date
+- ``salary_min`` / ``salary_max``: the advertised range in its own currency
+- ``salary_currency``: ISO code, ``salary_period``: hour, day, week, month or year
+- ``salary_annual_usd``: midpoint of the range per year in US dollars
+
+Sorting and salary analytics then work on numbers instead of re-parsing strings.
+Only amounts written as money count as salary: a number next to a currency
+marker, or a range such as "120,000 - 180,000". Stray numbers ("401(k)",
+"2 weeks PTO") are ignored.
+"""
+
+import re
+import time
+from typing import Dict, Optional
+
+SCHEMA_VERSION = 2  # Bump when the derived fields change so stored postings are normalized again
+
+# Approximate conversion rates, only used to compare salaries across currencies
+USD_RATES = {"USD": 1.0, "EUR": 1.08, "GBP": 1.27, "CAD": 0.73, "KES": 0.0077}
+PERIODS_PER_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+DEFAULT_POSTING_AGE = 30 * 86400  # seconds; used when the posting date cannot be parsed
+
+_CURRENCIES = {"$": "USD", "usd": "USD", "€": "EUR", "eur": "EUR", "£": "GBP", "gbp": "GBP",
+               "cad": "CAD", "kes": "KES", "ksh": "KES"}
+_CURRENCY = r"(?:\$|€|£|\b(?:usd|eur|gbp|cad|kes|ksh)\b)"
+_AMOUNT = r"(\d[\d,]*(?:\.\d+)?)\s*(k\b)?"
+_MONEY = rf"(?:{_CURRENCY}\s*)?{_AMOUNT}(?:\s*{_CURRENCY})?"  # an amount with optional currency on either side
+_CURRENCY_RE = re.compile(rf"({_CURRENCY})", re.IGNORECASE)
+_RANGE_RE = re.compile(rf"{_MONEY}\s*(?:-|–|—|\bto\b)\s*{_MONEY}", re.IGNORECASE)
+_CURRENCY_AMOUNT_RE = re.compile(rf"{_CURRENCY}\s*{_AMOUNT}|{_AMOUNT}\s*{_CURRENCY}", re.IGNORECASE)
+_PERIOD_RE = re.compile(r"(?:/|\bper\s+|\ban?\s+)(hour|hr|day|week|month|mo|year|yr|annum)\b", re.IGNORECASE)
+_AGE_RE = re.compile(r"\b(?:(\d+)\+?\s*)?(minute|hour|day|week|month)s?\b", re.IGNORECASE)
+
+_PERIOD_NAMES = {"hr": "hour", "mo": "month", "yr": "year", "annum": "year"}
+_AGE_SECONDS = {"minute": 60, "hour": 3600, "day": 86400, "week": 7 * 86400, "month": 30 * 86400}
+
+
+def parse_posted(text: str, now: Optional[float] = None) -> float:
+    """Timestamp of a relative posting date such as "2 days ago", counted back from now"""
+    now = time.time() if now is None else now
+    lowered = (text or "").lower()
+    if "yesterday" in lowered:
+        return now - _AGE_SECONDS["day"]
+    match = _AGE_RE.search(lowered)
+    if match is None:
+        return now if "today" in lowered or "recent" in lowered or "just" in lowered else now - DEFAULT_POSTING_AGE
+    count = int(match.group(1)) if match.group(1) else 1
+    return now - count * _AGE_SECONDS[match.group(2).lower()]
+
+
+def parse_salary(text: str) -> Dict[str, Optional[object]]:
+    """Range, currency and period of a salary string; amounts are None when there are none"""
+    text = text or ""
+    match = _RANGE_RE.search(text) or _CURRENCY_AMOUNT_RE.search(text)
+    groups = match.groups() if match else ()
+    # Pair up (number, "k") groups; alternatives that did not take part are None
+    amounts = [
+        float(number.replace(",", "")) * (1000 if thousands else 1)
+        for number, thousands in zip(groups[::2], groups[1::2]) if number is not None
+    ]
+    if not amounts:
+        return {"salary_min": None, "salary_max": None, "salary_currency": None,
+                "salary_period": None, "salary_annual_usd": None}
+
+    currency_match = _CURRENCY_RE.search(text)
+    currency = _CURRENCIES[currency_match.group(1).lower()] if currency_match else "USD"
+    period_match = _PERIOD_RE.search(text)
+    period = period_match.group(1).lower() if period_match else "year"
+    period = _PERIOD_NAMES.get(period, period)
+
+    salary_min, salary_max = min(amounts), max(amounts)
+    rate = USD_RATES.get(currency)
+    annual_usd = (salary_min + salary_max) / 2 * PERIODS_PER_YEAR[period] * rate if rate else None
+    return {"salary_min": salary_min, "salary_max": salary_max, "salary_currency": currency,
+            "salary_period": period, "salary_annual_usd": annual_usd}
+
+
+def normalize_job(job: Dict, now: Optional[float] = None) -> Dict:
+    """Copy of a posting with the typed date and salary fields added"""
+    normalized = dict(job)
+    if normalized.get("posted_at") is None:
+        normalized["posted_at"] = parse_posted(str(job.get("posted", "")), now)
+    normalized.update(parse_salary(str(job.get("salary", ""))))
+    return normalized
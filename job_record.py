@@ -0,0 +1,81 @@
+"""
+Immutable job records
+
+The search index holds every posting as a ``JobRecord``: a frozen dataclass
+that also reads like a read-only mapping (``job["title"]``, ``job.get("salary")``),
+so page code written against job dicts keeps working. The records can't be
+modified, so cached search results can be shared across sessions and threads
+without copying. Anything computed per user, such as match scores, travels
+separately, keyed by ``job_id``.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class JobRecord(Mapping):
+    """One normalized job posting"""
+
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    type: str = ""
+    experience: str = ""
+    salary: str = "Not specified"
+    description: str = ""
+    skills: Tuple[str, ...] = ()
+    posted: str = ""
+    apply_url: str = ""
+    source: str = ""
+    remote_friendly: bool = False
+    visa_sponsorship: bool = False
+    fingerprint: Optional[str] = None
+    posted_at: Optional[float] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_currency: Optional[str] = None
+    salary_period: Optional[str] = None
+    salary_annual_usd: Optional[float] = None
+    extra: Mapping = field(default_factory=lambda: MappingProxyType({}), compare=False)  # source-specific fields
+
+    @classmethod
+    def from_mapping(cls, job: Mapping) -> "JobRecord":
+        """Record from a job dict; unknown keys are kept, read-only, in ``extra``"""
+        if isinstance(job, JobRecord):
+            return job
+        values = {name: job[name] for name in _FIELD_NAMES if name in job and job[name] is not None}
+        if "skills" in values:
+            values["skills"] = tuple(values["skills"])
+        extra = {key: value for key, value in job.items() if key not in _FIELD_NAMES}
+        return cls(**values, extra=MappingProxyType(extra))
+
+    @property
+    def job_id(self) -> Optional[str]:
+        """Stable id of the posting (its ingest fingerprint)"""
+        return self.fingerprint
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, mutable copy of the posting"""
+        return dict(self)
+
+    def __reduce__(self):
+        # The read-only view in ``extra`` can't be pickled, so rebuild from a plain dict
+        return JobRecord.from_mapping, (self.to_dict(),)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_NAMES:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _FIELD_NAMES
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(_FIELD_NAMES) + len(self.extra)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(JobRecord) if f.name != "extra")
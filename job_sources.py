@@ -0,0 +1,167 @@
+"""
+Pluggable job source adapters
+
+Each source fetches postings from one job board and normalizes them to the job
+dict schema the Find Jobs page uses (title, company, location, type, experience,
+salary, description, skills, posted, apply_url, source, remote_friendly,
+visa_sponsorship). ``fetch_job_listings`` queries all enabled sources in
+parallel, giving each its own timeout, and returns whatever arrived in time
+together with the errors of the sources that failed or were too slow.
+
+``FixtureJobSource`` reads postings from a local JSON file, so the pipeline
+runs offline against the bundled sample data.
+"""
+
+import html
+import json
+from abc import ABC, abstractmethod
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+from http_client import RevalidatingClient
+
+SAMPLE_JOBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sample_jobs.json")
+ENABLED_SOURCES = [s.strip().lower() for s in os.environ.get("JOB_SOURCES", "sample").split(",") if s.strip()]
+SOURCE_TIMEOUT = 10.0  # seconds a source may take before its results are dropped
+
+# Shared pool so a slow source never holds up the caller once its deadline has passed
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="job-source")
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class JobSource(ABC):
+    """A job board: fetch raw postings, then normalize them to the job dict schema"""
+
+    name = "source"
+    timeout = SOURCE_TIMEOUT
+
+    @abstractmethod
+    def fetch(self, client: RevalidatingClient) -> Any:
+        """Raw postings as the board returns them"""
+
+    @abstractmethod
+    def normalize(self, raw: Any) -> List[Dict]:
+        """Postings in the job dict schema"""
+
+    def load(self, client: RevalidatingClient) -> List[Dict]:
+        """Fetch and normalize in one step"""
+        return self.normalize(self.fetch(client))
+
+
+class FixtureJobSource(JobSource):
+    """Postings stored locally as a JSON list already in the job dict schema"""
+
+    name = "sample"
+
+    def __init__(self, path: str = SAMPLE_JOBS_PATH):
+        self.path = path
+
+    def fetch(self, client: RevalidatingClient) -> List[Dict]:
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def normalize(self, raw: List[Dict]) -> List[Dict]:
+        return [dict(job) for job in raw]
+
+
+class RemoteOKJobSource(JobSource):
+    """Remote postings from the public RemoteOK API"""
+
+    name = "remoteok"
+    url = "https://remoteok.com/api"
+
+    def fetch(self, client: RevalidatingClient) -> List[Dict]:
+        response = client.get_json(self.url)
+        if not response.ok:
+            raise RuntimeError(f"RemoteOK returned {response.status_code}")
+        return response.data
+
+    @staticmethod
+    def _experience(title: str) -> str:
+        title = title.lower()
+        if "intern" in title or "student" in title:
+            return "Student"
+        if "senior" in title or "lead" in title or "principal" in title:
+            return "Senior Level"
+        if "junior" in title or "entry" in title or "graduate" in title:
+            return "Entry Level"
+        return "Mid Level"
+
+    @staticmethod
+    def _posted(epoch: Optional[float]) -> str:
+        if not epoch:
+            return "recently"
+        hours = int((time.time() - float(epoch)) // 3600)
+        if hours < 24:
+            return f"{max(hours, 1)} hours ago"
+        if hours < 24 * 14:
+            return f"{hours // 24} days ago"
+        return f"{hours // (24 * 7)} weeks ago"
+
+    def normalize(self, raw: List[Dict]) -> List[Dict]:
+        jobs = []
+        for item in raw:
+            if not isinstance(item, dict) or not item.get("position"):
+                continue  # The first element is the API's legal notice
+            salary_min, salary_max = item.get("salary_min"), item.get("salary_max")
+            description = html.unescape(_HTML_TAG_RE.sub(" ", item.get("description") or ""))
+            title = item["position"]
+            jobs.append({
+                "title": title,
+                "company": item.get("company") or "Unknown",
+                "location": item.get("location") or "Remote",
+                "type": "Internship" if "intern" in title.lower() else "Full-time",
+                "experience": self._experience(title),
+                "salary": f"${salary_min:,} - ${salary_max:,}" if salary_min and salary_max else "Not specified",
+                "description": " ".join(description.split())[:300],
+                "skills": [tag.title() for tag in (item.get("tags") or [])[:8]],
+                "posted": self._posted(item.get("epoch")),
+                "posted_at": float(item["epoch"]) if item.get("epoch") else None,
+                "apply_url": item.get("apply_url") or item.get("url") or "https://remoteok.com",
+                "source": "RemoteOK",
+                "remote_friendly": True,
+                "visa_sponsorship": False
+            })
+        return jobs
+
+
+SOURCE_REGISTRY = {
+    "sample": FixtureJobSource,
+    "remoteok": RemoteOKJobSource,
+}
+
+
+def get_enabled_sources(names: Optional[List[str]] = None) -> List[JobSource]:
+    """Instantiate the sources named in JOB_SOURCES (unknown names are ignored)"""
+    names = ENABLED_SOURCES if names is None else names
+    return [SOURCE_REGISTRY[name]() for name in names if name in SOURCE_REGISTRY]
+
+
+def fetch_job_listings(sources: List[JobSource], client: RevalidatingClient) -> Tuple[List[Dict], Dict[str, str]]:
+    """Load all sources in parallel; return the postings that arrived and errors by source name.
+
+    A source that has not finished by its own timeout is reported as an error and
+    its results are dropped, so one slow board only costs its timeout.
+    """
+    started_at = time.monotonic()
+    futures = [(source, _executor.submit(source.load, client)) for source in sources]
+
+    results: Dict[str, List[Dict]] = {}
+    errors: Dict[str, str] = {}
+    for source, future in sorted(futures, key=lambda pair: pair[0].timeout):
+        remaining = source.timeout - (time.monotonic() - started_at)
+        try:
+            results[source.name] = future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            errors[source.name] = f"timed out after {source.timeout:g}s"
+        except Exception as e:
+            errors[source.name] = str(e)
+
+    # Keep the configured source order so the corpus order is stable between refreshes
+    jobs = [job for source, _ in futures for job in results.get(source.name, [])]
+    return jobs, errors
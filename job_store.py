@@ -0,0 +1,221 @@
+"""
+Incremental job ingestion store
+
+Persists job postings in SQLite keyed by a stable fingerprint of company,
+title, location and apply URL. Each ingest compares the freshly loaded postings
+with the stored ones and returns only the delta (added, updated and removed
+postings), so the search index is patched rather than rebuilt. Several processes
+can share one store, so an index syncs with ``delta_since``: the difference
+between the content hashes it holds and the stored rows, whoever ingested them. A posting that
+several sources list under the same fingerprint is stored once, and postings
+no source has listed for ``JOB_EXPIRE_AFTER`` seconds are expired. The grace
+period keeps one timed-out source from wiping its postings from the corpus.
+
+Added and changed postings are normalized (``job_normalize``) on the way in.
+Unchanged postings keep their stored fields, so a relative date such as
+"2 days ago" stays anchored to the ingest that first saw it.
+
+New postings are also checked against a MinHash/LSH index of the corpus: a
+re-worded repost of a stored role is folded into the original instead of being
+stored again, so result pages, analytics and recommendations count it once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import ContextManager, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from job_dedup import NearDuplicateIndex
+from job_normalize import SCHEMA_VERSION, normalize_job
+from sqlite_db import connect, prepare_database
+
+JOB_STORE_PATH = os.environ.get(
+    "JOB_STORE_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "jobs.sqlite3")
+)
+JOB_EXPIRE_AFTER = int(os.environ.get("JOB_EXPIRE_AFTER", str(24 * 3600)))  # seconds unseen before expiry
+
+
+def _normalize_text(value) -> str:
+    return " ".join(str(value or "").lower().split())
+
+
+def _normalize_url(url) -> str:
+    # Tracking parameters and fragments differ between boards linking the same posting
+    parts = urlsplit(str(url or "").strip())
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def job_fingerprint(job: Dict) -> str:
+    """Stable id of a posting from its company, title, location and apply URL"""
+    key = "\x1f".join([
+        _normalize_text(job.get("company")),
+        _normalize_text(job.get("title")),
+        _normalize_text(job.get("location")),
+        _normalize_url(job.get("apply_url")),
+    ])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash(job: Dict) -> str:
+    """Hash of a posting's source content, used to detect edits under the same fingerprint"""
+    if job.get("posted_at") is not None:
+        # The relative "posted" text is derived from posted_at and the clock, so it changes by itself
+        job = {key: value for key, value in job.items() if key != "posted"}
+    payload = json.dumps([SCHEMA_VERSION, job], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class JobDelta:
+    """Changes to the stored corpus, keyed by fingerprint, with the content hash of each added or updated posting"""
+
+    added: Dict[str, Dict] = field(default_factory=dict)
+    updated: Dict[str, Dict] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    hashes: Dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class JobStore:
+    """SQLite-backed corpus of job postings with delta-producing ingests"""
+
+    def __init__(self, path: str = JOB_STORE_PATH, expire_after: int = JOB_EXPIRE_AFTER):
+        self.path = path
+        self.expire_after = expire_after
+        self._lock = threading.Lock()  # One ingest at a time, so deltas never interleave
+        self._near_duplicates: Optional[NearDuplicateIndex] = None  # Built from the corpus on first ingest
+        prepare_database(path, [
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " sources TEXT NOT NULL,"
+            " first_seen REAL NOT NULL,"
+            " last_seen REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen)",
+        ])
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return connect(self.path)
+
+    def active_jobs(self) -> Dict[str, Dict]:
+        """All stored postings by fingerprint, in the order they were first seen"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT fingerprint, payload FROM jobs ORDER BY first_seen, rowid"
+            ).fetchall()
+        return {fingerprint: json.loads(payload) for fingerprint, payload in rows}
+
+    def last_ingested_at(self) -> Optional[float]:
+        """Time of the most recent ingest that saw any stored posting, or None when empty"""
+        with self._connect() as conn:
+            return conn.execute("SELECT MAX(last_seen) FROM jobs").fetchone()[0]
+
+    def delta_since(self, known: Dict[str, str]) -> JobDelta:
+        """What changed relative to a corpus holding the given fingerprint -> content hash pairs"""
+        delta = JobDelta()
+        stored = set()
+        with self._connect() as conn:
+            rows = conn.execute("SELECT fingerprint, payload, content_hash FROM jobs ORDER BY first_seen, rowid")
+            for fingerprint, payload, digest in rows:
+                stored.add(fingerprint)
+                if known.get(fingerprint) == digest:
+                    continue
+                changes = delta.updated if fingerprint in known else delta.added
+                changes[fingerprint] = json.loads(payload)
+                delta.hashes[fingerprint] = digest
+        delta.removed = [fingerprint for fingerprint in known if fingerprint not in stored]
+        return delta
+
+    def ingest(self, jobs: Iterable[Dict], now: Optional[float] = None) -> JobDelta:
+        """Upsert freshly loaded postings, expire long-unseen ones, and return what changed.
+
+        Each returned posting carries its ``fingerprint``. Postings sharing a
+        fingerprint, and new postings that near-duplicate a known one, are
+        collapsed into the first one, remembering every source.
+        """
+        now = time.time() if now is None else now
+        incoming: Dict[str, Dict] = {}
+        sources: Dict[str, List[str]] = {}
+        for job in jobs:
+            fingerprint = job_fingerprint(job)
+            source = job.get("source") or "unknown"
+            if fingerprint not in incoming:
+                incoming[fingerprint] = dict(job, fingerprint=fingerprint)
+                sources[fingerprint] = []
+            if source not in sources[fingerprint]:
+                sources[fingerprint].append(source)
+
+        with self._lock:
+            try:
+                return self._apply_ingest(incoming, sources, now)
+            except Exception:
+                self._near_duplicates = None  # May hold postings the failed ingest never stored
+                raise
+
+    def _apply_ingest(self, incoming: Dict[str, Dict], sources: Dict[str, List[str]], now: float) -> JobDelta:
+        delta = JobDelta()
+        with self._connect() as conn:
+            stored = dict(conn.execute("SELECT fingerprint, content_hash FROM jobs").fetchall())
+            near_duplicates = self._near_duplicate_index(conn)
+            for fingerprint, job in list(incoming.items()):
+                if fingerprint in stored:
+                    continue
+                original = near_duplicates.find(job, exclude=fingerprint)
+                if original is None:
+                    near_duplicates.add(fingerprint, job)
+                    continue
+                # A reworded repost keeps the original alive under the original's fingerprint
+                del incoming[fingerprint]
+                merged = sources.setdefault(original, [])
+                merged.extend(source for source in sources.pop(fingerprint) if source not in merged)
+
+            upserts, touched = [], []
+            for fingerprint in sources:
+                job = incoming.get(fingerprint)
+                digest = content_hash(job) if job is not None else None
+                if job is None or stored.get(fingerprint) == digest:
+                    touched.append((now, json.dumps(sources[fingerprint]), fingerprint))
+                    continue
+                job = normalize_job(job, now)
+                if fingerprint in stored:
+                    delta.updated[fingerprint] = job
+                    near_duplicates.add(fingerprint, job)
+                else:
+                    delta.added[fingerprint] = job
+                delta.hashes[fingerprint] = digest
+                upserts.append((fingerprint, json.dumps(job), digest, json.dumps(sources[fingerprint]), now, now))
+
+            conn.executemany(
+                "INSERT INTO jobs (fingerprint, payload, content_hash, sources, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (fingerprint) DO UPDATE SET"
+                " payload = excluded.payload, content_hash = excluded.content_hash,"
+                " sources = excluded.sources, last_seen = excluded.last_seen",
+                upserts
+            )
+            conn.executemany("UPDATE jobs SET last_seen = ?, sources = ? WHERE fingerprint = ?", touched)
+
+            cutoff = now - self.expire_after
+            delta.removed = [row[0] for row in conn.execute(
+                "SELECT fingerprint FROM jobs WHERE last_seen < ?", (cutoff,)
+            )]
+            conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,))
+            for fingerprint in delta.removed:
+                near_duplicates.remove(fingerprint)
+        return delta
+
+    def _near_duplicate_index(self, conn: sqlite3.Connection) -> NearDuplicateIndex:
+        if self._near_duplicates is None:
+            self._near_duplicates = NearDuplicateIndex()
+            for fingerprint, payload in conn.execute("SELECT fingerprint, payload FROM jobs"):
+                self._near_duplicates.add(fingerprint, json.loads(payload))
+        return self._near_duplicates
@@ -0,0 +1,315 @@
+"""
+Columnar job table for filtering
+
+Holds the filterable attributes of the job corpus as columns: categorical codes
+for type and experience, boolean arrays for remote and visa sponsorship, and a
+categorical location dimension. Each search filter compiles to a boolean mask,
+and combining filters is a few vectorized operations however many postings there
+are. Location substring tests run once per distinct location, not once per job.
+
+Rows can be appended, replaced and removed in place as the corpus changes, and
+an edit only encodes the row it touches. Category codes are handed out in
+first-seen order and never change, the columns are arrays that grow by
+doubling, and the skill pairs of replaced rows are tombstoned and compacted
+once they make up half of the pairs.
+
+The same columns answer facet queries: given the mask of a result set, counts
+per company, skill, location, type, experience, visa status and salary band
+are ``np.bincount`` calls over category codes, and each filter option's count
+is one more mask intersection.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Locations reachable through remote work even when the posting is based elsewhere
+REMOTE_ACCESSIBLE_LOCATIONS = {
+    "nairobi": ["remote", "nairobi"],
+    "kenya": ["remote", "nairobi", "kenya"],
+    "africa": ["remote", "nairobi", "africa"],
+}
+INTERNATIONAL_LOCATIONS = ["san francisco", "new york", "seattle", "austin", "london", "berlin", "toronto", "sydney"]
+
+# Experience filter -> experience levels it admits
+EXPERIENCE_LEVELS = {
+    "entry level": ["entry level"],
+    "mid level": ["mid level", "entry level"],
+    "senior level": ["senior level"],
+    "student": ["student"],
+}
+
+# Annual USD salary bands: (lower bound, label); postings without a parsed salary are "Not specified"
+SALARY_BANDS = [
+    (0, "Under $50k"),
+    (50_000, "$50k - $100k"),
+    (100_000, "$100k - $150k"),
+    (150_000, "$150k - $200k"),
+    (200_000, "$200k+"),
+]
+
+CATEGORY_COLUMNS = ("type", "experience", "location", "company")
+
+
+class _Categories:
+    """Codes of the distinct values of one column, in first-seen order"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _reserve(array: np.ndarray, size: int) -> np.ndarray:
+    """The array, or a copy with doubled capacity when size does not fit"""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array), 16), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class JobTable:
+    """Column-oriented view of the job attributes used by the search filters"""
+
+    def __init__(self, jobs: Iterable[Dict] = ()):
+        self._size = 0
+        self._labels: Dict[str, str] = {}  # lowercased filter value -> display label as first seen
+        self._categories = {column: _Categories() for column in CATEGORY_COLUMNS}
+        self._codes = {column: np.zeros(0, dtype=np.int64) for column in CATEGORY_COLUMNS}
+        self._remote = np.zeros(0, dtype=bool)
+        self._visa = np.zeros(0, dtype=bool)
+        self._salary = np.zeros(0, dtype=float)
+        self._alive = np.zeros(0, dtype=bool)
+        # Skills are multi-valued: one (row, skill code) pair per skill of each posting,
+        # with a code of -1 marking the pairs of replaced or removed rows
+        self._skills = _Categories()
+        self._skill_rows = np.zeros(0, dtype=np.int64)
+        self._skill_codes = np.zeros(0, dtype=np.int64)
+        self._skill_pairs = 0
+        self._dead_pairs = 0
+        self._skill_spans: List[Tuple[int, int]] = []  # per row: its pairs' [start, stop)
+        self._location_terms: Dict[str, np.ndarray] = {}  # term -> whether each location category contains it
+        for job in jobs:
+            self.set_row(len(self), job)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def remote(self) -> np.ndarray:
+        return self._remote[:self._size]
+
+    @property
+    def visa(self) -> np.ndarray:
+        return self._visa[:self._size]
+
+    @property
+    def salary(self) -> np.ndarray:
+        return self._salary[:self._size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[:self._size]
+
+    def _column(self, column: str) -> np.ndarray:
+        return self._codes[column][:self._size]
+
+    def set_row(self, row: int, job: Dict) -> None:
+        """Store a job's attributes at a row, appending when row is one past the end"""
+        if row == self._size:
+            self._size += 1
+            for column in CATEGORY_COLUMNS:
+                self._codes[column] = _reserve(self._codes[column], self._size)
+            self._remote = _reserve(self._remote, self._size)
+            self._visa = _reserve(self._visa, self._size)
+            self._salary = _reserve(self._salary, self._size)
+            self._alive = _reserve(self._alive, self._size)
+            self._skill_spans.append((0, 0))
+
+        for column in ("type", "experience", "location"):
+            value = str(job.get(column, ""))
+            self._labels.setdefault(value.lower(), value)
+            self._codes[column][row] = self._categories[column].code(value.lower())
+        self._codes["company"][row] = self._categories["company"].code(str(job.get("company", "")))
+        self._remote[row] = bool(job.get("remote_friendly", False))
+        self._visa[row] = bool(job.get("visa_sponsorship", False))
+        salary = job.get("salary_annual_usd")
+        self._salary[row] = float(salary) if salary else np.nan
+        self._alive[row] = True
+        self._set_skills(row, dict.fromkeys(job.get("skills") or ()))
+
+    def remove(self, row: int) -> None:
+        """Exclude a row from every mask; its position stays reserved so row ids remain stable"""
+        self._alive[row] = False
+        self._set_skills(row, ())
+
+    def _set_skills(self, row: int, skills: Iterable[str]) -> None:
+        start, stop = self._skill_spans[row]
+        self._skill_codes[start:stop] = -1
+        self._dead_pairs += stop - start
+
+        codes = [self._skills.code(skill) for skill in skills]
+        start, stop = self._skill_pairs, self._skill_pairs + len(codes)
+        self._skill_rows = _reserve(self._skill_rows, stop)
+        self._skill_codes = _reserve(self._skill_codes, stop)
+        self._skill_rows[start:stop] = row
+        self._skill_codes[start:stop] = codes
+        self._skill_pairs = stop
+        self._skill_spans[row] = (start, stop)
+
+        if self._dead_pairs * 2 > self._skill_pairs:
+            self._compact_skills()
+
+    def _compact_skills(self) -> None:
+        live = self._skill_codes[:self._skill_pairs] >= 0
+        positions = np.cumsum(live) - 1  # new position of every live pair
+        self._skill_spans = [
+            (int(positions[start]), int(positions[start]) + stop - start) if stop > start else (0, 0)
+            for start, stop in self._skill_spans
+        ]
+        self._skill_rows = self._skill_rows[:self._skill_pairs][live]
+        self._skill_codes = self._skill_codes[:self._skill_pairs][live]
+        self._skill_pairs = len(self._skill_codes)
+        self._dead_pairs = 0
+
+    def _category_mask(self, column: str, values: List[str]) -> np.ndarray:
+        """Rows whose categorical value is one of values, compared on integer codes"""
+        codes = self._categories[column].codes
+        wanted = [codes[value] for value in values if value in codes]
+        return np.isin(self._column(column), wanted)
+
+    def location_contains(self, term: str) -> np.ndarray:
+        """Rows whose location mentions term (evaluated once per distinct location and cached)"""
+        locations = self._categories["location"].values
+        per_category = self._location_terms.get(term, np.zeros(0, dtype=bool))
+        if len(per_category) < len(locations):
+            new = [term in location for location in locations[len(per_category):]]
+            per_category = self._location_terms[term] = np.concatenate([per_category, np.array(new, dtype=bool)])
+        return per_category[self._column("location")]
+
+    def location_mask(self, location: str) -> np.ndarray:
+        """Rows matching a location filter, counting remote-friendly jobs where they are reachable"""
+        location = location.lower()
+        if location == "any":
+            return np.ones(len(self), dtype=bool)
+
+        mask = self.location_contains(location)
+        if location in ("remote", "hybrid"):
+            mask |= self.remote
+        elif location == "on-site":
+            mask |= ~self.remote
+        elif location in REMOTE_ACCESSIBLE_LOCATIONS:
+            for term in REMOTE_ACCESSIBLE_LOCATIONS[location]:
+                mask |= self.location_contains(term)
+        elif location in INTERNATIONAL_LOCATIONS:
+            mask |= self.remote
+        return mask
+
+    def experience_mask(self, experience_level: str) -> np.ndarray:
+        """Rows matching an experience filter; "All" and unknown filters admit every row"""
+        levels = EXPERIENCE_LEVELS.get(experience_level.lower())
+        if levels is None:
+            return np.ones(len(self), dtype=bool)
+        return self._category_mask("experience", levels)
+
+    def type_mask(self, job_type: str) -> np.ndarray:
+        """Rows matching a job type filter"""
+        if job_type.lower() == "all":
+            return np.ones(len(self), dtype=bool)
+        return self._category_mask("type", [job_type.lower()])
+
+    def visa_mask(self, visa_sponsorship: str) -> np.ndarray:
+        """Rows matching a visa sponsorship filter"""
+        visa_sponsorship = visa_sponsorship.lower()
+        if visa_sponsorship == "required":
+            return self.visa.copy()
+        if visa_sponsorship == "not required":
+            return ~self.visa
+        return np.ones(len(self), dtype=bool)
+
+    def filter_mask(self, location: str = "Any", experience_level: str = "All",
+                    job_type: str = "All", visa_sponsorship: str = "Any") -> np.ndarray:
+        """Combined boolean mask of all search filters, excluding removed rows"""
+        return (self.alive
+                & self.location_mask(location)
+                & self.experience_mask(experience_level)
+                & self.type_mask(job_type)
+                & self.visa_mask(visa_sponsorship))
+
+    def _option_mask(self, dimension: str, option: str) -> np.ndarray:
+        masks = {"location": self.location_mask, "experience_level": self.experience_mask,
+                 "job_type": self.type_mask, "visa_sponsorship": self.visa_mask}
+        return masks[dimension](option)
+
+    def option_counts(self, base: np.ndarray, selected: Dict[str, str],
+                      options: Dict[str, List[str]]) -> Dict[str, Dict[str, int]]:
+        """Rows each filter option would return, keeping the other filters at their selected values.
+
+        ``selected`` and ``options`` are keyed by filter (location, experience_level,
+        job_type, visa_sponsorship); base is the keyword match mask.
+        """
+        base = base & self.alive
+        dimension_masks = {dimension: self._option_mask(dimension, value) for dimension, value in selected.items()}
+        counts = {}
+        for dimension, values in options.items():
+            others = base.copy()
+            for other, mask in dimension_masks.items():
+                if other != dimension:
+                    others &= mask
+            counts[dimension] = {value: int(np.count_nonzero(others & self._option_mask(dimension, value)))
+                                 for value in values}
+        return counts
+
+    @staticmethod
+    def _ranked(labels: Iterable[str], tallies: np.ndarray) -> Dict[str, int]:
+        """Non-zero counts by label, largest first, ties in label order"""
+        labels = list(labels)
+        order = sorted(np.flatnonzero(tallies), key=lambda i: (-tallies[i], labels[i]))
+        return {labels[i]: int(tallies[i]) for i in order}
+
+    def facet_counts(self, mask: np.ndarray) -> Dict[str, Dict[str, int]]:
+        """Counts per company, skill, location, type, experience, visa, remote and salary band among masked rows"""
+        rows = mask & self.alive
+        counts: Dict[str, Dict[str, int]] = {}
+        for column in ("company", "location", "type", "experience"):
+            categories = self._categories[column].values
+            tallies = np.bincount(self._column(column)[rows], minlength=len(categories))
+            labels = categories if column == "company" else [self._labels.get(value, value) for value in categories]
+            counts[column] = self._ranked(labels, tallies)
+
+        skill_rows = self._skill_rows[:self._skill_pairs]
+        skill_codes = self._skill_codes[:self._skill_pairs]
+        counted = (skill_codes >= 0) & rows[skill_rows]
+        skill_tallies = np.bincount(skill_codes[counted], minlength=len(self._skills))
+        counts["skill"] = self._ranked(self._skills.values, skill_tallies)
+
+        counts["visa"] = {"Sponsored": int(np.count_nonzero(rows & self.visa)),
+                          "Not sponsored": int(np.count_nonzero(rows & ~self.visa))}
+        counts["remote"] = {"Remote friendly": int(np.count_nonzero(rows & self.remote)),
+                            "Not remote": int(np.count_nonzero(rows & ~self.remote))}
+
+        salaries = self.salary[rows]
+        known = salaries[~np.isnan(salaries)]
+        bands = np.bincount(np.digitize(known, [lower for lower, _ in SALARY_BANDS[1:]]), minlength=len(SALARY_BANDS))
+        counts["salary_band"] = {label: int(count) for (_, label), count in zip(SALARY_BANDS, bands)}
+        counts["salary_band"]["Not specified"] = int(len(salaries) - len(known))
+        return counts
+
+    def salary_stats(self, mask: np.ndarray) -> Dict[str, float]:
+        """Count, mean, min and max annual USD salary among masked rows with a parsed salary"""
+        salaries = self.salary[mask & self.alive]
+        salaries = salaries[~np.isnan(salaries)]
+        if not len(salaries):
+            return {"count": 0}
+        return {"count": int(len(salaries)), "mean": float(salaries.mean()),
+                "min": float(salaries.min()), "max": float(salaries.max())}
@@ -9,14 +9,16 @@ Specialization: AI, Computer Vision, NLP, Software Engineering
 import streamlit as st
 from streamlit_option_menu import option_menu
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from PIL import Image
 import json
-import requests
+import logging
 import time
 import random
 import os
+import threading
 from datetime import datetime, timedelta
 from streamlit_lottie import st_lottie
 from reportlab.lib.pagesizes import letter, A4
@@ -25,11 +27,28 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
 from io import BytesIO
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 import re
 from bs4 import BeautifulSoup
 
+from github_ratelimit import GitHubTokenPool
+from github_api import skill_profile
+from github_store import GitHubSnapshotStore
+from http_client import RevalidatingClient
+from job_embeddings import SemanticJobIndex
+from job_index import JobIndex
+from job_sources import JobSource, fetch_job_listings, get_enabled_sources
+from job_store import JobStore
+from profile_service import DEFAULT_USERNAME, PREFETCH_USERNAMES, GitHubProfileService
+from job_record import JobRecord
+from recommendations import (RECOMMENDATION_MODE, PageCursor, Recommendations, SkillMatcher, profile_document,
+                             profile_fingerprint, top_k)
+from refresher import BackgroundRefresher
+from singleflight import LOCK_DIR, SingleFlight
+
+logger = logging.getLogger(__name__)
+
     # Page configuration
 st.set_page_config(
     page_title="Julius Mutugu - AI Software Engineer",
@@ -38,6 +57,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_http_client() -> RevalidatingClient:
+    """Process-wide pooled HTTP client with timeouts, retries and ETag revalidation"""
+    return RevalidatingClient()
+
     # Custom CSS for professional styling with dual theme support
 def load_css(theme="modern_light"):
     if theme == "modern_light":
@@ -459,73 +483,59 @@ def load_css(theme="modern_light"):
 def load_lottie_url(url: str):
     """Load Lottie animation from URL"""
     try:
-        r = requests.get(url)
-        if r.status_code != 200:
+        response = get_http_client().get_json(url)
+        if not response.ok:
             return None
-        return r.json()
+        return response.data
     except:
         return None
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_github_profile_image(username: str = "JuliusMutugu") -> str:
-    """Get GitHub profile image URL"""
-    try:
-        response = requests.get(f"https://api.github.com/users/{username}")
-        if response.status_code == 200:
-            user_data = response.json()
-            return user_data.get('avatar_url', '')
-        return ''
-    except:
-        return ''
+@st.cache_resource
+def get_github_token_pool() -> GitHubTokenPool:
+    """Process-wide GitHub token pool (GITHUB_TOKENS / GITHUB_TOKEN) with rate-limit budgets"""
+    return GitHubTokenPool.from_env()
+
+@st.cache_resource
+def get_github_snapshot_store() -> GitHubSnapshotStore:
+    """Process-wide persistent store of the last good GitHub payloads"""
+    return GitHubSnapshotStore()
+
+@st.cache_resource
+def get_single_flight() -> SingleFlight:
+    """Process-wide request coalescer, optionally locking across processes via LOCK_DIR"""
+    return SingleFlight(lock_dir=LOCK_DIR)
+
+@st.cache_resource
+def get_refresher() -> BackgroundRefresher:
+    """Process-wide stale-while-revalidate refresher for job data"""
+    return BackgroundRefresher()
+
+@st.cache_resource
+def get_profile_service() -> GitHubProfileService:
+    """Process-wide GitHub profile service shared by every session and username"""
+    service = GitHubProfileService(
+        client=get_http_client(),
+        store=get_github_snapshot_store(),
+        token_pool=get_github_token_pool(),
+        single_flight=get_single_flight()
+    )
+    if PREFETCH_USERNAMES:
+        # Warm the hosted profiles without holding up the first page render
+        threading.Thread(target=service.prefetch, args=(PREFETCH_USERNAMES,), daemon=True).start()
+    return service
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def fetch_github_data(username: str = "JuliusMutugu") -> Dict:
-    """Fetch GitHub user data and repositories with caching"""
-    try:
-        # Fetch user data
-        user_response = requests.get(f"https://api.github.com/users/{username}")
-        if user_response.status_code != 200:
-            return {"error": "User not found"}
-        
-        user_data = user_response.json()
-        
-        # Fetch repositories
-        repos_response = requests.get(f"https://api.github.com/users/{username}/repos?per_page=100&sort=updated")
-        if repos_response.status_code != 200:
-            return {"error": "Repositories not found"}
-        
-        repos_data = repos_response.json()
-        
-        # Process repository data
-        processed_repos = []
-        for repo in repos_data[:20]:  # Limit to recent 20 repos
-            processed_repos.append({
-                "name": repo["name"],
-                "description": repo["description"] or "No description available",
-                "language": repo["language"] or "Unknown",
-                "stars": repo["stargazers_count"],
-                "forks": repo["forks_count"],
-                "updated_at": repo["updated_at"],
-                "html_url": repo["html_url"],
-                "topics": repo.get("topics", [])
-            })
-        
-        return {
-            "user": {
-                "name": user_data["name"] or username,
-                "bio": user_data["bio"] or "No bio available",
-                "public_repos": user_data["public_repos"],
-                "followers": user_data["followers"],
-                "following": user_data["following"],
-                "avatar_url": user_data["avatar_url"],
-                "location": user_data["location"],
-                "company": user_data["company"],
-                "blog": user_data["blog"]
-            },
-            "repositories": processed_repos
-        }
-    except Exception as e:
-        return {"error": f"Failed to fetch GitHub data: {str(e)}"}
+def fetch_github_data(username: str = DEFAULT_USERNAME) -> Dict:
+    """Fetch GitHub user data and repositories.
+
+    Served from the profile service's in-memory LRU, renewed in the background
+    shortly before the hourly expiry; a cold profile starts from the snapshot store.
+    """
+    return get_profile_service().get(username)
+
+def get_github_profile_image(username: str = DEFAULT_USERNAME) -> str:
+    """Get GitHub profile image URL from the same user payload as fetch_github_data"""
+    github_data = fetch_github_data(username)
+    return github_data.get('user', {}).get('avatar_url', '') or ''
 
 def generate_job_application_package(company_name: str, position: str, github_data: Dict) -> Dict:
     """Generate customized job application package with enhanced personalization"""
@@ -791,464 +801,184 @@ def create_application_pdf(company_name: str, position: str, application_data: D
     buffer.seek(0)
     return buffer
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
+@st.cache_resource
+def get_job_sources() -> List[JobSource]:
+    """Job source adapters enabled through JOB_SOURCES (defaults to the bundled sample data)"""
+    return get_enabled_sources()
+
+@st.cache_resource
+def get_job_source_errors() -> Dict[str, str]:
+    """Errors of the sources that failed the latest load, by source name, shared by every session"""
+    return {}
+
+def load_job_listings() -> List[Dict]:
+    """Load the raw job listings from all enabled sources in parallel"""
+    jobs, errors = fetch_job_listings(get_job_sources(), get_http_client())
+    for name, error in errors.items():
+        logger.warning("Job source %s failed: %s", name, error)
+    source_errors = get_job_source_errors()
+    source_errors.clear()
+    source_errors.update(errors)
+    return jobs
+
+@st.cache_resource
+def get_job_store() -> JobStore:
+    """Process-wide persistent job corpus keyed by posting fingerprint"""
+    return JobStore()
+
+@st.cache_resource
+def get_job_index() -> JobIndex:
+    """Process-wide search index, seeded from the stored corpus and patched by each ingest"""
+    job_index = JobIndex()
+    job_index.sync(get_job_store())
+    return job_index
+
+def refresh_job_index() -> JobIndex:
+    """Ingest the current listings and re-index only the postings that differ from the store"""
+    job_index = get_job_index()
+    job_index.sync(get_job_store(), load_job_listings())
+    return job_index
+
+def load_stored_job_index():
+    """Serve the index built from the stored corpus while the first ingest runs in the background"""
+    last_ingested_at = get_job_store().last_ingested_at()
+    return (get_job_index(), last_ingested_at) if last_ingested_at else None
+
+def current_job_index() -> JobIndex:
+    """The shared job index; listings are re-ingested in the background and only changed postings re-indexed"""
+    return get_refresher().get("job_index", refresh_job_index, ttl=1800, load=load_stored_job_index)
+
+JOBS_PAGE_SIZE = 10  # Job cards rendered per "Load more" page
+DEFAULT_JOB_KEYWORDS = "AI, Machine Learning, Python, Software Engineer"
+JOB_FILTER_OPTIONS = {
+    "job_type": ["All", "Full-time", "Internship", "Contract", "Part-time"],
+    "experience_level": ["All", "Entry Level", "Mid Level", "Senior Level", "Student"],
+    "location": [
+        "Any", "Remote", "On-site", "Hybrid",
+        "Nairobi", "Kenya", "Africa",
+        "San Francisco", "New York", "Seattle", "Austin",
+        "London", "Berlin", "Toronto", "Sydney"
+    ],
+    "visa_sponsorship": ["Any", "Required", "Not Required"],
+}
+FAANG_COMPANIES = ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple']
+
+def parse_job_keywords(keywords: str) -> List[str]:
+    """Split the comma-separated keywords input, falling back to the default engineering roles"""
+    if keywords:
+        return [k.strip() for k in keywords.split(",")]
+    return ["Software Engineer", "AI Engineer", "ML Engineer"]
+
+@st.cache_data(ttl=1800, max_entries=512)
+def job_search_facets(keywords: List[str], location: str = "Any", experience_level: str = "All",
+                      job_type: str = "All", visa_sponsorship: str = "Any", corpus_version: int = 0) -> Dict:
+    """Facet counts of a search, aggregated from the index columns (cached like scrape_job_opportunities)"""
+    return current_job_index().facets(keywords, location, experience_level, job_type, visa_sponsorship,
+                                      options=JOB_FILTER_OPTIONS)
+
+# Entries are keyed by the query and the corpus version, so a corpus change makes new entries
+# instead of clearing anyone else's, and outdated ones age out through the TTL and size bound.
+# The results are tuples of immutable records, so every session shares them without a copy.
+@st.cache_resource(ttl=1800, max_entries=512)
 def scrape_job_opportunities(keywords: List[str] = ["Software Engineer", "AI Engineer", "ML Engineer"], 
                            location: str = "Remote", 
                            experience_level: str = "Entry Level",
                            job_type: str = "All",
-                           visa_sponsorship: str = "Any") -> List[Dict]:
-    """Scrape job opportunities from multiple sources"""
-    jobs = []
-    
-    # Job board APIs and scraping targets
-    job_sources = {
-        "GitHub Jobs": "https://jobs.github.com/positions.json",
-        "RemoteOK": "https://remoteok.io/api",
-        "AngelList": "https://angel.co/jobs",
-        "Indeed": "https://indeed.com",
-        "LinkedIn": "https://linkedin.com/jobs"
-    }
-    
-    # Sample job data (since actual scraping requires proper setup)
-    sample_jobs = [
-        {
-            "title": "AI/ML Software Engineer",
-            "company": "Google",
-            "location": "Mountain View, CA / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$120,000 - $180,000",
-            "description": "Join Google's AI team to develop cutting-edge machine learning solutions",
-            "skills": ["Python", "TensorFlow", "Machine Learning", "Computer Vision"],
-            "posted": "2 days ago",
-            "apply_url": "https://careers.google.com/jobs/results/",
-            "source": "Google Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Software Development Engineer - AI",
-            "company": "Microsoft",
-            "location": "Seattle, WA / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$110,000 - $170,000",
-            "description": "Build intelligent applications using Azure AI services and machine learning",
-            "skills": ["C#", "Python", "Azure", "AI/ML", "Software Engineering"],
-            "posted": "1 day ago",
-            "apply_url": "https://careers.microsoft.com/",
-            "source": "Microsoft Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Machine Learning Engineer",
-            "company": "Amazon",
-            "location": "Austin, TX / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$115,000 - $175,000",
-            "description": "Develop ML models for AWS services and customer-facing applications",
-            "skills": ["Python", "AWS", "PyTorch", "Distributed Systems", "ML Engineering"],
-            "posted": "3 days ago",
-            "apply_url": "https://amazon.jobs/",
-            "source": "Amazon Jobs",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "AI Research Engineer",
-            "company": "Meta",
-            "location": "Menlo Park, CA / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$125,000 - $190,000",
-            "description": "Research and develop AI technologies for Meta's platforms and metaverse",
-            "skills": ["Python", "PyTorch", "Computer Vision", "NLP", "Research"],
-            "posted": "1 week ago",
-            "apply_url": "https://www.metacareers.com/",
-            "source": "Meta Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "iOS Software Engineer - ML",
-            "company": "Apple",
-            "location": "Cupertino, CA / Hybrid",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$130,000 - $200,000",
-            "description": "Integrate machine learning capabilities into iOS applications",
-            "skills": ["Swift", "iOS", "Core ML", "Python", "Mobile Development"],
-            "posted": "4 days ago",
-            "apply_url": "https://jobs.apple.com/",
-            "source": "Apple Jobs",
-            "remote_friendly": False,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Software Engineer Intern - AI/ML",
-            "company": "OpenAI",
-            "location": "San Francisco, CA / Remote",
-            "type": "Internship",
-            "experience": "Student",
-            "salary": "$8,000 - $12,000/month",
-            "description": "Summer internship working on large language models and AI safety",
-            "skills": ["Python", "PyTorch", "Transformers", "NLP", "Research"],
-            "posted": "2 weeks ago",
-            "apply_url": "https://openai.com/careers/",
-            "source": "OpenAI Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Junior Data Scientist",
-            "company": "Netflix",
-            "location": "Los Gatos, CA / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$105,000 - $160,000",
-            "description": "Apply ML to improve content recommendation and user experience",
-            "skills": ["Python", "SQL", "Machine Learning", "Statistics", "Data Science"],
-            "posted": "5 days ago",
-            "apply_url": "https://jobs.netflix.com/",
-            "source": "Netflix Jobs",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Backend Engineer - AI Platform",
-            "company": "Spotify",
-            "location": "Stockholm, Sweden / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "€70,000 - €95,000",
-            "description": "Build scalable backend systems for Spotify's AI-powered features",
-            "skills": ["Java", "Python", "Distributed Systems", "ML Infrastructure", "Kubernetes"],
-            "posted": "1 week ago",
-            "apply_url": "https://www.lifeatspotify.com/",
-            "source": "Spotify Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Computer Vision Engineer",
-            "company": "Tesla",
-            "location": "Palo Alto, CA / On-site",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "$120,000 - $180,000",
-            "description": "Develop computer vision algorithms for autonomous driving",
-            "skills": ["Python", "OpenCV", "Deep Learning", "Computer Vision", "C++"],
-            "posted": "3 days ago",
-            "apply_url": "https://www.tesla.com/careers/",
-            "source": "Tesla Careers",
-            "remote_friendly": False,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Machine Learning Intern",
-            "company": "Uber",
-            "location": "San Francisco, CA / Remote",
-            "type": "Internship",
-            "experience": "Student",
-            "salary": "$7,500 - $10,000/month",
-            "description": "Summer internship in ML engineering for ride-sharing optimization",
-            "skills": ["Python", "Scikit-learn", "TensorFlow", "Data Analysis", "Statistics"],
-            "posted": "1 week ago",
-            "apply_url": "https://www.uber.com/careers/",
-            "source": "Uber Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Software Engineer - Fintech",
-            "company": "M-Pesa (Safaricom)",
-            "location": "Nairobi, Kenya / Hybrid",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "KES 1,500,000 - KES 2,500,000",
-            "description": "Build mobile financial services for Africa's leading fintech platform",
-            "skills": ["Java", "Kotlin", "Android", "Microservices", "Financial Systems"],
-            "posted": "3 days ago",
-            "apply_url": "https://www.safaricom.co.ke/careers/",
-            "source": "Safaricom Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Data Scientist - AI Research",
-            "company": "iHub Kenya",
-            "location": "Nairobi, Kenya",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "KES 1,200,000 - KES 2,000,000",
-            "description": "Research and develop AI solutions for African challenges in agriculture and healthcare",
-            "skills": ["Python", "R", "Machine Learning", "Data Science", "Research"],
-            "posted": "1 week ago",
-            "apply_url": "https://ihub.co.ke/careers/",
-            "source": "iHub Kenya",
-            "remote_friendly": False,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Backend Developer - E-commerce",
-            "company": "Jumia Kenya",
-            "location": "Nairobi, Kenya / Remote",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "KES 1,000,000 - KES 1,800,000",
-            "description": "Develop scalable e-commerce solutions for Africa's largest online marketplace",
-            "skills": ["PHP", "Laravel", "MySQL", "AWS", "E-commerce"],
-            "posted": "5 days ago",
-            "apply_url": "https://group.jumia.com/careers/",
-            "source": "Jumia Group",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Mobile App Developer",
-            "company": "Twiga Foods",
-            "location": "Nairobi, Kenya",
-            "type": "Full-time",
-            "experience": "Entry Level",
-            "salary": "KES 900,000 - KES 1,500,000",
-            "description": "Build mobile applications for agricultural supply chain management",
-            "skills": ["Flutter", "Dart", "Firebase", "Mobile Development", "Agriculture Tech"],
-            "posted": "1 week ago",
-            "apply_url": "https://twiga.ke/careers/",
-            "source": "Twiga Foods",
-            "remote_friendly": False,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Senior Data Engineer",
-            "company": "Airbnb",
-            "location": "San Francisco, CA / Remote",
-            "type": "Full-time",
-            "experience": "Senior Level",
-            "salary": "$180,000 - $250,000",
-            "description": "Lead data infrastructure and analytics platform development",
-            "skills": ["Python", "Spark", "Kafka", "AWS", "Data Engineering"],
-            "posted": "2 days ago",
-            "apply_url": "https://careers.airbnb.com/",
-            "source": "Airbnb Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Frontend Developer",
-            "company": "Shopify",
-            "location": "Ottawa, Canada / Remote",
-            "type": "Contract",
-            "experience": "Mid Level",
-            "salary": "$80,000 - $120,000",
-            "description": "Build beautiful and functional e-commerce user interfaces",
-            "skills": ["React", "TypeScript", "CSS", "JavaScript", "GraphQL"],
-            "posted": "1 day ago",
-            "apply_url": "https://www.shopify.com/careers/",
-            "source": "Shopify Careers",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "DevOps Engineer Intern",
-            "company": "Stripe",
-            "location": "Dublin, Ireland / Hybrid",
-            "type": "Internship",
-            "experience": "Student",
-            "salary": "€4,000 - €6,000/month",
-            "description": "Summer internship in cloud infrastructure and deployment automation",
-            "skills": ["Docker", "Kubernetes", "AWS", "Terraform", "CI/CD"],
-            "posted": "3 days ago",
-            "apply_url": "https://stripe.com/jobs/",
-            "source": "Stripe Careers",
-            "remote_friendly": False,
-            "visa_sponsorship": True
-        },
-        {
-            "title": "Part-time Python Tutor",
-            "company": "Codecademy",
-            "location": "Remote",
-            "type": "Part-time",
-            "experience": "Entry Level",
-            "salary": "$25 - $40/hour",
-            "description": "Help students learn Python programming through online tutoring",
-            "skills": ["Python", "Teaching", "Communication", "Programming"],
-            "posted": "1 week ago",
-            "apply_url": "https://www.codecademy.com/about/careers/",
-            "source": "Codecademy",
-            "remote_friendly": True,
-            "visa_sponsorship": False
-        },
-        {
-            "title": "Blockchain Developer",
-            "company": "Coinbase",
-            "location": "San Francisco, CA / On-site",
-            "type": "Full-time",
-            "experience": "Mid Level",
-            "salary": "$150,000 - $220,000",
-            "description": "Develop secure and scalable cryptocurrency trading systems",
-            "skills": ["Solidity", "Web3", "Blockchain", "JavaScript", "Security"],
-            "posted": "4 days ago",
-            "apply_url": "https://www.coinbase.com/careers/",
-            "source": "Coinbase Careers",
-            "remote_friendly": False,
-            "visa_sponsorship": True
-        }
-    ]
-    
-    # Filter jobs based on criteria with enhanced search
-    filtered_jobs = []
-    for job in sample_jobs:
-        # Enhanced keyword filtering - more flexible matching
-        keyword_match = True
-        if keywords and any(k.strip() for k in keywords):  # Only filter if keywords provided and not empty
-            job_text = f"{job['title']} {job['description']} {' '.join(job['skills'])} {job['company']}".lower()
-            # Check for partial matches and synonyms
-            keyword_match = False
-            for keyword in keywords:
-                keyword = keyword.lower().strip()
-                if keyword:
-                    # Direct match
-                    if keyword in job_text:
-                        keyword_match = True
-                        break
-                    # Synonym matching for common terms
-                    if keyword in ["ai", "artificial intelligence"] and ("ai" in job_text or "artificial intelligence" in job_text or "machine learning" in job_text):
-                        keyword_match = True
-                        break
-                    elif keyword in ["ml", "machine learning"] and ("ml" in job_text or "machine learning" in job_text or "ai" in job_text):
-                        keyword_match = True
-                        break
-                    elif keyword in ["software", "developer", "engineer"] and any(term in job_text for term in ["software", "developer", "engineer", "development"]):
-                        keyword_match = True
-                        break
-                    elif keyword in ["data", "analyst", "scientist"] and any(term in job_text for term in ["data", "analyst", "scientist", "analytics"]):
-                        keyword_match = True
-                        break
-        
-        if keyword_match:
-            # Enhanced location filtering
-            location_match = False
-            job_location = job['location'].lower()
-            location_filter = location.lower()
-            
-            if location_filter == "any":
-                location_match = True
-            elif location_filter == "remote" and job['remote_friendly']:
-                location_match = True
-            elif location_filter == "on-site" and not job['remote_friendly']:
-                location_match = True
-            elif location_filter == "hybrid" and ("hybrid" in job_location or job['remote_friendly']):
-                location_match = True
-            elif location_filter in job_location:
-                location_match = True
-            # Handle specific cities and countries
-            elif location_filter == "nairobi" and ("remote" in job_location or "nairobi" in job_location):
-                location_match = True  # Remote jobs are accessible from Nairobi
-            elif location_filter == "kenya" and ("remote" in job_location or "nairobi" in job_location or "kenya" in job_location):
-                location_match = True
-            elif location_filter == "africa" and ("remote" in job_location or "nairobi" in job_location or "africa" in job_location):
-                location_match = True
-            # International locations accessible via remote
-            elif job['remote_friendly'] and location_filter in ["san francisco", "new york", "seattle", "austin", "london", "berlin", "toronto", "sydney"]:
-                location_match = True
-            
-            # Filter by experience level if specified
-            experience_match = True
-            if experience_level.lower() != "all":
-                job_exp = job['experience'].lower()
-                exp_filter = experience_level.lower()
-                
-                if exp_filter == "entry level" and job_exp != "entry level":
-                    experience_match = False
-                elif exp_filter == "mid level" and job_exp not in ["mid level", "entry level"]:
-                    experience_match = False
-                elif exp_filter == "senior level" and job_exp != "senior level":
-                    experience_match = False
-                elif exp_filter == "student" and job_exp != "student":
-                    experience_match = False
-            
-            # Filter by job type if specified
-            job_type_match = True
-            if job_type.lower() != "all":
-                if job_type.lower() != job['type'].lower():
-                    job_type_match = False
-            
-            # Filter by visa sponsorship if specified
-            visa_match = True
-            if visa_sponsorship.lower() != "any":
-                if visa_sponsorship.lower() == "required" and not job.get('visa_sponsorship', False):
-                    visa_match = False
-                elif visa_sponsorship.lower() == "not required" and job.get('visa_sponsorship', False):
-                    visa_match = False
-            
-            if location_match and experience_match and job_type_match and visa_match:
-                filtered_jobs.append(job)
-    
-    # Sort by posted date (newest first) - convert "X days/weeks ago" to datetime for sorting
-    def parse_posted_date(posted_str):
-        from datetime import datetime, timedelta
-        import re
-        
-        if "day" in posted_str:
-            days = int(re.findall(r'\d+', posted_str)[0]) if re.findall(r'\d+', posted_str) else 0
-            return datetime.now() - timedelta(days=days)
-        elif "week" in posted_str:
-            weeks = int(re.findall(r'\d+', posted_str)[0]) if re.findall(r'\d+', posted_str) else 1
-            return datetime.now() - timedelta(weeks=weeks)
-        elif "hour" in posted_str:
-            hours = int(re.findall(r'\d+', posted_str)[0]) if re.findall(r'\d+', posted_str) else 0
-            return datetime.now() - timedelta(hours=hours)
-        else:
-            return datetime.now() - timedelta(days=30)  # Default to 30 days ago
-    
-    # Add parsed date for sorting and sort by date (newest first)
-    for job in filtered_jobs:
-        job['parsed_date'] = parse_posted_date(job['posted'])
-    
-    filtered_jobs.sort(key=lambda x: x['parsed_date'], reverse=True)
-    
-    return filtered_jobs
-
-def get_job_recommendations(github_data: Dict, user_skills: List[str]) -> List[Dict]:
-    """Get personalized job recommendations based on GitHub activity and skills"""
-    
-    # Extract skills from GitHub repositories
-    github_languages = []
-    if github_data.get('repositories'):
-        for repo in github_data['repositories']:
-            if repo.get('language'):
-                github_languages.append(repo['language'])
-            # Extract skills from repository topics
-            github_languages.extend(repo.get('topics', []))
-    
-    # Combine user skills with GitHub-derived skills
-    all_skills = list(set(user_skills + github_languages))
+                           visa_sponsorship: str = "Any",
+                           corpus_version: int = 0) -> Tuple[JobRecord, ...]:
+    """Scrape job opportunities from multiple sources.
+
+    Pass ``current_job_index().version`` as corpus_version so results are never served from an older corpus.
+    """
+    job_index = current_job_index()
+    
+    # Keyword search runs against the inverted index (any keyword, with synonyms), ranked by BM25;
+    # location, experience, job type and visa filters compile to one vectorized mask
+    matches, relevance = job_index.query(keywords, location, experience_level, job_type, visa_sponsorship)
+    
+    # Best matches first, newest first among equally relevant jobs (posted_at is parsed at ingest)
+    matches.sort(key=lambda x: (relevance[x[0]], x[1].posted_at or 0.0), reverse=True)
+    
+    return tuple(job for _, job in matches)
+
+@st.cache_resource(max_entries=2)
+def get_skill_matcher(corpus_version: int) -> SkillMatcher:
+    """Skill incidence of the job corpus, encoded once per corpus version"""
+    return SkillMatcher((job['fingerprint'], job) for _, job in current_job_index().live_jobs())
+
+RECOMMENDATIONS_PAGE_SIZE = 5  # Recommended jobs per "Load more" page
+MIN_MATCH_SCORE = 0.0  # Jobs scoring below this are never recommended
+PROFILE_SKILLS = ["Python", "Machine Learning", "Computer Vision", "NLP", "Software Engineering"]
+
+@st.cache_resource(max_entries=2)
+def get_recommendation_candidates(corpus_version: int) -> Tuple[Tuple[JobRecord, ...], np.ndarray]:
+    """Jobs eligible for recommendation, with their matcher rows (-1 when unknown to the matcher)"""
+    jobs = scrape_job_opportunities(corpus_version=corpus_version)
+    matcher = get_skill_matcher(corpus_version)
+    rows = np.array([matcher.rows.get(job.job_id, -1) for job in jobs], dtype=np.int64)
+    return jobs, rows
+
+@st.cache_resource(max_entries=2)
+def get_semantic_job_index(corpus_version: int) -> SemanticJobIndex:
+    """Embeddings of the recommendation candidates, built once per corpus version"""
+    jobs, _ = get_recommendation_candidates(corpus_version)
+    return SemanticJobIndex(jobs)
+
+def get_job_recommendations(github_data: Dict, user_skills: List[str],
+                            k: int = RECOMMENDATIONS_PAGE_SIZE,
+                            min_score: float = MIN_MATCH_SCORE,
+                            cursor: Optional[PageCursor] = None,
+                            mode: str = RECOMMENDATION_MODE) -> Recommendations:
+    """Get a page of personalized job recommendations based on GitHub activity and skills.
+
+    Pass the previous page's ``next_cursor`` to continue where it ended; if the
+    corpus or the profile has changed since, the first page is returned instead.
+    With mode "semantic" jobs are ranked by embedding similarity to the whole profile.
+    """
+    
+    # Skill vector derived when the profile was fetched; snapshots stored before it existed are derived here
+    github_skills = github_data.get('skill_profile') or skill_profile(github_data.get('repositories') or [])
+    
+    # Listed skills count in full; GitHub skills by their recency- and star-weighted share,
+    # merged case-insensitively keeping the higher weight
+    profile = {skill: 1.0 for skill in user_skills}
+    seen = {skill.lower(): skill for skill in profile}
+    for skill, weight in github_skills.items():
+        name = seen.setdefault(skill.lower(), skill)
+        profile[name] = max(profile.get(name, 0.0), weight)
+    all_skills = list(profile)
     
     # Get job opportunities
-    jobs = scrape_job_opportunities()
-    
-    # Score jobs based on skill match
-    scored_jobs = []
-    for job in jobs:
-        skill_matches = 0
-        for skill in all_skills:
-            job_skills_text = ' '.join(job['skills']).lower()
-            job_desc_text = job['description'].lower()
-            if skill.lower() in job_skills_text or skill.lower() in job_desc_text:
-                skill_matches += 1
-        
-        job['match_score'] = (skill_matches / len(job['skills'])) * 100 if job['skills'] else 0
-        job['matched_skills'] = [skill for skill in all_skills 
-                               if skill.lower() in ' '.join(job['skills']).lower()]
-        scored_jobs.append(job)
+    corpus_version = current_job_index().version
+    jobs, rows = get_recommendation_candidates(corpus_version)
+    
+    matcher = get_skill_matcher(corpus_version)
+    document = profile_document(github_data, all_skills) if mode == "semantic" else ""
+    ranking = profile_fingerprint(mode, profile, document)
+    if cursor is not None and (cursor.corpus_version, cursor.profile) != (corpus_version, ranking):
+        # Positions index a candidate list or profile that no longer exists; start over
+        cursor = None
+    
+    if mode == "semantic":
+        # Nearest neighbours of the profile embedding; jobs outside the probed lists score -inf
+        candidate_scores = get_semantic_job_index(corpus_version).scores(document)
+    else:
+        # Score every job in one sparse pass over the skill incidence of the corpus
+        match_scores = matcher.match_scores(profile)
+        candidate_scores = np.where(rows >= 0, match_scores[rows], 0.0)
     
-    # Sort by match score
-    scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+    # Select only this page's best matches instead of sorting every job
+    page, has_more = top_k(candidate_scores, k, min_score, cursor.after if cursor else None)
+    page_jobs = [jobs[position] for position in page]
     
-    return scored_jobs
+    # Scores are kept apart from the shared job records, keyed by job id
+    scores = {job.job_id: float(candidate_scores[position]) for job, position in zip(page_jobs, page)}
+    matched_skills = {job.job_id: matcher.matched_skills(job.job_id, all_skills) for job in page_jobs}
+    next_cursor = None
+    if has_more and len(page):
+        next_cursor = PageCursor((float(candidate_scores[page[-1]]), int(page[-1])), corpus_version, ranking)
+    
+    return Recommendations(page_jobs, scores, matched_skills, next_cursor, first_page=cursor is None)
 
 def create_job_alert_system(user_email: str, keywords: List[str], location: str) -> Dict:
     """Create a job alert system (simulation)"""
@@ -1684,7 +1414,7 @@ def show_projects():
     
     # Fetch GitHub data
     with st.spinner("Loading latest projects from GitHub..."):
-        github_data = fetch_github_data("JuliusMutugu")
+        github_data = fetch_github_data()
     
     # Project categories
     categories = ["All", "Computer Vision", "Natural Language Processing", "Machine Learning", "Web Development", "Mobile Development", "Data Analysis"]
@@ -2518,7 +2248,7 @@ def show_apply():
     
     # Fetch GitHub data for real-time updates
     with st.spinner("Loading latest GitHub data..."):
-        github_data = fetch_github_data("JuliusMutugu")
+        github_data = fetch_github_data()
     
     if "error" in github_data:
         st.error(f"GitHub data unavailable: {github_data['error']}")
@@ -2537,6 +2267,13 @@ def show_apply():
         total_stars = sum(r.get('stars', 0) for r in github_data.get('repositories', []))
         st.metric("Total Stars", total_stars)
     
+    # GitHub API budget (refreshes pause and cached data is served while degraded)
+    budget = get_github_token_pool().status()
+    if budget["remaining"] is not None:
+        reset_time = datetime.fromtimestamp(budget["reset_at"]).strftime("%H:%M")
+        mode = "serving cached data" if budget["degraded"] else "live"
+        st.caption(f"GitHub API budget: {budget['remaining']}/{budget['limit']} requests left, resets at {reset_time} ({mode})")
+    
     st.markdown("---")
     
     # Career objective with GitHub integration
@@ -2754,10 +2491,17 @@ def show_apply():
                 )
                 st.plotly_chart(fig, use_container_width=True)
                 
-                # Languages used
+                # Languages used: byte counts when the GraphQL backend supplies them, else primary languages
+                language_bytes = {}
+                for repo in recent_repos:
+                    for language, size in repo.get('languages', {}).items():
+                        language_bytes[language] = language_bytes.get(language, 0) + size
                 languages = [repo['language'] for repo in recent_repos if repo['language']]
-                if languages:
+                if language_bytes:
+                    lang_counts = pd.Series(language_bytes).sort_values(ascending=False)
+                elif languages:
                     lang_counts = pd.Series(languages).value_counts()
+                if language_bytes or languages:
                     fig_pie = go.Figure(data=go.Pie(labels=lang_counts.index, values=lang_counts.values))
                     fig_pie.update_layout(title="Programming Languages Used")
                     st.plotly_chart(fig_pie, use_container_width=True)
@@ -3110,56 +2854,89 @@ def show_jobs():
             location=auto_params['location'],
             experience_level=auto_params['experience'],
             job_type=auto_params['job_type'],
-            visa_sponsorship=auto_params['visa']
+            visa_sponsorship=auto_params['visa'],
+            corpus_version=current_job_index().version
         )
         
         # Get GitHub data for recommendations
-        github_data = fetch_github_data("julimore")
-        user_skills = ["Python", "Machine Learning", "Computer Vision", "NLP", "Software Engineering"]
+        github_data = fetch_github_data()
+        user_skills = PROFILE_SKILLS
         recommended_jobs = get_job_recommendations(github_data, user_skills)
         
         # Store in session state
         st.session_state.job_results = jobs
+        st.session_state.job_query = dict(
+            keywords=auto_params['keywords'],
+            location=auto_params['location'],
+            experience_level=auto_params['experience'],
+            job_type=auto_params['job_type'],
+            visa_sponsorship=auto_params['visa']
+        )
         st.session_state.recommended_jobs = recommended_jobs
+        st.session_state.jobs_shown = JOBS_PAGE_SIZE
         
         st.success(f"Found {len(jobs)} jobs for: {', '.join(auto_params['keywords'])}")
 
     # Job search filters
     st.markdown(f'<h3 style="{secondary_color}">Search Filters</h3>', unsafe_allow_html=True)
     
+    # Live result counts per filter option, for the keywords and filters as currently entered
+    option_counts = job_search_facets(
+        keywords=parse_job_keywords(st.session_state.get("job_keywords", DEFAULT_JOB_KEYWORDS)),
+        location=st.session_state.get("job_location", "Any"),
+        experience_level=st.session_state.get("job_experience_level", "All"),
+        job_type=st.session_state.get("job_type", "All"),
+        visa_sponsorship=st.session_state.get("job_visa_sponsorship", "Any"),
+        corpus_version=current_job_index().version
+    )["options"]
+    
+    def with_count(dimension):
+        return lambda option: f"{option} ({option_counts[dimension].get(option, 0)})"
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        job_type = st.selectbox("Job Type", ["All", "Full-time", "Internship", "Contract", "Part-time"])
+        job_type = st.selectbox("Job Type", JOB_FILTER_OPTIONS["job_type"],
+                                key="job_type", format_func=with_count("job_type"))
     
     with col2:
-        experience_level = st.selectbox("Experience Level", ["All", "Entry Level", "Mid Level", "Senior Level", "Student"])
+        experience_level = st.selectbox("Experience Level", JOB_FILTER_OPTIONS["experience_level"],
+                                        key="job_experience_level", format_func=with_count("experience_level"))
     
     with col3:
-        location_pref = st.selectbox("Location", [
-            "Any", "Remote", "On-site", "Hybrid", 
-            "Nairobi", "Kenya", "Africa",
-            "San Francisco", "New York", "Seattle", "Austin", 
-            "London", "Berlin", "Toronto", "Sydney"
-        ])
+        location_pref = st.selectbox("Location", JOB_FILTER_OPTIONS["location"],
+                                     key="job_location", format_func=with_count("location"))
     
     with col4:
-        visa_sponsorship = st.selectbox("Visa Sponsorship", ["Any", "Required", "Not Required"])
+        visa_sponsorship = st.selectbox("Visa Sponsorship", JOB_FILTER_OPTIONS["visa_sponsorship"],
+                                        key="job_visa_sponsorship", format_func=with_count("visa_sponsorship"))
     
     # Keywords search
     keywords = st.text_input("Keywords (comma-separated)", 
-                           value="AI, Machine Learning, Python, Software Engineer",
+                           value=DEFAULT_JOB_KEYWORDS,
+                           key="job_keywords",
                            help="Enter job-related keywords separated by commas")
     
-    if keywords:
-        keyword_list = [k.strip() for k in keywords.split(",")]
-    else:
-        keyword_list = ["Software Engineer", "AI Engineer", "ML Engineer"]
+    keyword_list = parse_job_keywords(keywords)
+    
+    # Search button; "Refresh listings" re-ingests the sources before searching
+    search_col, refresh_col = st.columns([3, 1])
+    with search_col:
+        search_clicked = st.button("🔍 Search Jobs", type="primary")
+    with refresh_col:
+        refresh_clicked = st.button("🔄 Refresh listings", help="Fetch the latest postings from every job source")
     
-    # Search button
-    if st.button("🔍 Search Jobs", type="primary"):
-        # Clear any existing cache to ensure fresh results
-        scrape_job_opportunities.clear()
+    if search_clicked or refresh_clicked:
+        if refresh_clicked:
+            with st.spinner("Fetching the latest postings..."):
+                # Cached searches stop matching only if the ingest actually changed the corpus
+                refresh_job_index()
+        
+        # Failed sources keep their stored postings until they expire, so the search still runs
+        source_errors = get_job_source_errors()
+        if source_errors:
+            failed = ", ".join(f"{name} ({error})" for name, error in source_errors.items())
+            st.warning(f"Some job sources could not be loaded: {failed}. Showing the postings already stored for them.")
         
         with st.spinner("Searching for opportunities..."):
             jobs = scrape_job_opportunities(
@@ -3167,24 +2944,43 @@ def show_jobs():
                 location=location_pref, 
                 experience_level=experience_level,
                 job_type=job_type,
-                visa_sponsorship=visa_sponsorship
+                visa_sponsorship=visa_sponsorship,
+                corpus_version=current_job_index().version
             )
             
             # Debug information
             st.info(f"Applied filters: Keywords: {keyword_list}, Location: {location_pref}, Experience: {experience_level}, Job Type: {job_type}, Visa: {visa_sponsorship}")
             
             # Get GitHub data for recommendations
-            github_data = fetch_github_data("julimore")  # Replace with actual username
-            user_skills = ["Python", "Machine Learning", "Computer Vision", "NLP", "Software Engineering"]
+            github_data = fetch_github_data()
+            user_skills = PROFILE_SKILLS
             recommended_jobs = get_job_recommendations(github_data, user_skills)
             
             # Store in session state
             st.session_state.job_results = jobs
+            st.session_state.job_query = dict(
+                keywords=keyword_list,
+                location=location_pref,
+                experience_level=experience_level,
+                job_type=job_type,
+                visa_sponsorship=visa_sponsorship
+            )
             st.session_state.recommended_jobs = recommended_jobs
+            st.session_state.jobs_shown = JOBS_PAGE_SIZE
+    
+    # Re-run the saved search at the current corpus version on every rerun, so the result list and
+    # the facet counts below describe the same corpus state after a background ingest (both are cached)
+    results_version = current_job_index().version
+    if 'job_query' in st.session_state:
+        st.session_state.job_results = scrape_job_opportunities(**st.session_state.job_query,
+                                                                corpus_version=results_version)
     
     # Display job results
     if 'job_results' in st.session_state and st.session_state.job_results:
         jobs = st.session_state.job_results
+        # Counts for the searched query come from the index columns, not from walking the result dicts
+        facets = job_search_facets(**st.session_state.job_query, corpus_version=results_version)
+        facet_values = facets["values"]
         
         # Job statistics
         st.markdown(f'<h3 style="{secondary_color}">Search Results ({len(jobs)} opportunities found)</h3>', 
@@ -3193,10 +2989,10 @@ def show_jobs():
         # Quick stats
         stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
         
-        remote_jobs = len([j for j in jobs if j.get('remote_friendly')])
-        visa_jobs = len([j for j in jobs if j.get('visa_sponsorship')])
-        internships = len([j for j in jobs if j.get('type') == 'Internship'])
-        faang_jobs = len([j for j in jobs if j.get('company') in ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple']])
+        remote_jobs = facet_values['remote']['Remote friendly']
+        visa_jobs = facet_values['visa']['Sponsored']
+        internships = facet_values['type'].get('Internship', 0)
+        faang_jobs = sum(facet_values['company'].get(company, 0) for company in FAANG_COMPANIES)
         
         with stat_col1:
             st.metric("Remote Jobs", remote_jobs)
@@ -3213,7 +3009,9 @@ def show_jobs():
         with tab1:
             st.markdown(f'<h4 style="{accent_color}">All Job Opportunities</h4>', unsafe_allow_html=True)
             
-            for job in jobs:
+            # Results are ranked best match first, so render one page at a time
+            jobs_shown = st.session_state.get('jobs_shown', JOBS_PAGE_SIZE)
+            for job in jobs[:jobs_shown]:
                 with st.container():
                     # Job card styling
                     card_bg = "#f8fafc" if theme == 'light' else "#1e293b"
@@ -3258,7 +3056,7 @@ def show_jobs():
                             package = generate_job_application_package(
                                 job['company'], 
                                 job['title'], 
-                                fetch_github_data("julimore")
+                                fetch_github_data()
                             )
                             
                             # Create download link
@@ -3272,10 +3070,16 @@ def show_jobs():
                             )
                     
                     st.markdown("---")
+            
+            if len(jobs) > jobs_shown:
+                if st.button(f"Load more ({len(jobs) - jobs_shown} remaining)", key="load_more_jobs"):
+                    st.session_state.jobs_shown = jobs_shown + JOBS_PAGE_SIZE
+                    st.rerun()
         
         with tab2:
             if 'recommended_jobs' in st.session_state:
-                recommended = st.session_state.recommended_jobs[:5]  # Top 5 recommendations
+                recommendations = st.session_state.recommended_jobs
+                recommended = recommendations.jobs  # Pages of top matches loaded so far
                 
                 st.markdown(f'<h4 style="{accent_color}">Personalized Recommendations</h4>', unsafe_allow_html=True)
                 st.info("These jobs are recommended based on your GitHub activity and skills profile.")
@@ -3283,8 +3087,8 @@ def show_jobs():
                 for job in recommended:
                     with st.container():
                         # Enhanced job card for recommendations
-                        match_score = job.get('match_score', 0)
-                        matched_skills = job.get('matched_skills', [])
+                        match_score = recommendations.scores.get(job.job_id, 0)
+                        matched_skills = recommendations.matched_skills.get(job.job_id, [])
                         
                         # Match score color
                         if match_score >= 80:
@@ -3323,7 +3127,7 @@ def show_jobs():
                             package = generate_job_application_package(
                                 job['company'], 
                                 job['title'], 
-                                fetch_github_data("julimore")
+                                fetch_github_data()
                             )
                             
                             pdf_buffer = create_application_pdf(job['company'], job['title'], package)
@@ -3336,39 +3140,32 @@ def show_jobs():
                             )
                         
                         st.markdown("---")
+                
+                if recommendations.next_cursor is not None:
+                    if st.button("Load more recommendations", key="load_more_recommendations"):
+                        next_page = get_job_recommendations(fetch_github_data(), PROFILE_SKILLS,
+                                                            cursor=recommendations.next_cursor)
+                        if next_page.first_page:
+                            # Listings or profile changed since the last page: show the new ranking
+                            st.session_state.recommended_jobs = next_page
+                        else:
+                            st.session_state.recommended_jobs = Recommendations(
+                                recommendations.jobs + next_page.jobs,
+                                {**recommendations.scores, **next_page.scores},
+                                {**recommendations.matched_skills, **next_page.matched_skills},
+                                next_page.next_cursor
+                            )
+                        st.rerun()
         
         with tab3:
             st.markdown(f'<h4 style="{accent_color}">Job Market Analytics</h4>', unsafe_allow_html=True)
             
             # Company distribution
             if jobs:
-                company_counts = {}
-                salary_data = []
-                skill_counts = {}
-                
-                for job in jobs:
-                    # Company distribution
-                    company = job['company']
-                    company_counts[company] = company_counts.get(company, 0) + 1
-                    
-                    # Salary data (extract numbers for analysis)
-                    salary_str = job.get('salary', '')
-                    if '$' in salary_str and '-' in salary_str:
-                        try:
-                            salary_range = salary_str.replace('$', '').replace(',', '').replace('/month', '')
-                            if '/month' in job.get('salary', ''):
-                                # Convert monthly to yearly
-                                low, high = [int(x.strip()) * 12 for x in salary_range.split('-')]
-                            else:
-                                low, high = [int(x.strip()) for x in salary_range.split('-')]
-                            avg_salary = (low + high) / 2
-                            salary_data.append(avg_salary)
-                        except:
-                            pass
-                    
-                    # Skill frequency
-                    for skill in job.get('skills', []):
-                        skill_counts[skill] = skill_counts.get(skill, 0) + 1
+                # Facet counts arrive sorted, largest first
+                company_counts = facet_values['company']
+                skill_counts = facet_values['skill']
+                salary_stats = facets['salary']
                 
                 # Visualizations
                 anal_col1, anal_col2 = st.columns(2)
@@ -3399,7 +3196,7 @@ def show_jobs():
                 with anal_col2:
                     st.markdown("**Most In-Demand Skills**")
                     if skill_counts:
-                        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                        top_skills = list(skill_counts.items())[:10]
                         skills, skill_count = zip(*top_skills)
                         
                         fig_skills = px.bar(
@@ -3418,19 +3215,27 @@ def show_jobs():
                         st.plotly_chart(fig_skills, use_container_width=True)
                 
                 # Salary analysis
-                if salary_data:
+                if salary_stats['count']:
                     st.markdown("**Salary Distribution**")
-                    avg_salary = sum(salary_data) / len(salary_data)
-                    min_salary = min(salary_data)
-                    max_salary = max(salary_data)
                     
                     salary_col1, salary_col2, salary_col3 = st.columns(3)
                     with salary_col1:
-                        st.metric("Average Salary", f"${avg_salary:,.0f}")
+                        st.metric("Average Salary", f"${salary_stats['mean']:,.0f}")
                     with salary_col2:
-                        st.metric("Min Salary", f"${min_salary:,.0f}")
+                        st.metric("Min Salary", f"${salary_stats['min']:,.0f}")
                     with salary_col3:
-                        st.metric("Max Salary", f"${max_salary:,.0f}")
+                        st.metric("Max Salary", f"${salary_stats['max']:,.0f}")
+                    
+                    salary_bands = {band: count for band, count in facet_values['salary_band'].items()
+                                    if band != 'Not specified'}
+                    fig_salary = px.bar(
+                        x=list(salary_bands.keys()),
+                        y=list(salary_bands.values()),
+                        title="Openings by Annual Salary (USD)",
+                        labels={'x': 'Salary band', 'y': 'Openings'}
+                    )
+                    fig_salary.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
+                    st.plotly_chart(fig_salary, use_container_width=True)
     else:
         # No search performed yet or no results found
         st.markdown(f'<h3 style="{secondary_color}">🚀 Get Started</h3>', unsafe_allow_html=True)
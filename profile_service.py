@@ -0,0 +1,99 @@
+"""
+Multi-user GitHub profile service
+
+One service per process serves processed GitHub profiles for any number of
+usernames. Profiles live in a bounded LRU that is renewed in the background,
+cold profiles start from the shared snapshot store, and upstream fetches are
+coalesced per username, so memory and GitHub calls scale with the number of
+active users rather than with page visits.
+
+Set GITHUB_BACKEND=graphql (with a token configured) to fetch profiles in one
+GraphQL query per page, which adds per-repository language byte counts.
+
+Each fetched profile carries a ``skill_profile`` (see ``github_api.skill_profile``),
+computed once per fetch and stored with the snapshot.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from github_api import fetch_github_profile, skill_profile
+from github_graphql import fetch_github_profile_graphql
+from github_ratelimit import GitHubTokenPool
+from github_store import GitHubSnapshotStore
+from http_client import RevalidatingClient
+from refresher import BackgroundRefresher
+from singleflight import SingleFlight
+
+DEFAULT_USERNAME = os.environ.get("GITHUB_USERNAME", "JuliusMutugu")
+PREFETCH_USERNAMES = [u.strip() for u in os.environ.get("GITHUB_PREFETCH_USERS", "").split(",") if u.strip()]
+MAX_PROFILES = int(os.environ.get("GITHUB_MAX_PROFILES", "256"))
+PROFILE_TTL = 3600  # seconds
+GITHUB_BACKEND = os.environ.get("GITHUB_BACKEND", "rest").lower()  # "rest" or "graphql"
+
+
+class GitHubProfileService:
+    """Serve processed GitHub profiles keyed by username"""
+
+    def __init__(self,
+                 client: RevalidatingClient,
+                 store: GitHubSnapshotStore,
+                 token_pool: Optional[GitHubTokenPool] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 max_profiles: int = MAX_PROFILES,
+                 ttl: int = PROFILE_TTL,
+                 backend: str = GITHUB_BACKEND):
+        self.client = client
+        self.backend = backend
+        self.store = store
+        self.token_pool = token_pool
+        self.single_flight = single_flight or SingleFlight()
+        self.ttl = ttl
+        self._profiles = BackgroundRefresher(max_entries=max_profiles)
+
+    @staticmethod
+    def _key(username: str) -> str:
+        # GitHub logins are case-insensitive, so "JuliusMutugu" and "juliusmutugu" share an entry
+        return f"github_data:{username.lower()}"
+
+    def _fetch_upstream(self, username: str) -> Dict:
+        # GraphQL needs a token; without one, fall back to the REST backend
+        if self.backend == "graphql" and self.token_pool is not None and self.token_pool.authenticated:
+            profile = fetch_github_profile_graphql(self.client, username, self.token_pool)
+        else:
+            profile = fetch_github_profile(self.client, username, token_pool=self.token_pool)
+        if "error" not in profile:
+            profile["skill_profile"] = skill_profile(profile.get("repositories", []))
+        return profile
+
+    def get(self, username: str = DEFAULT_USERNAME) -> Dict:
+        """Return the processed profile for a username (``{"error": ...}`` if unavailable)"""
+        key = self._key(username)
+
+        def load():
+            snapshot = self.store.load(key)
+            return (snapshot["payload"], snapshot["fetched_at"]) if snapshot else None
+
+        def stored_since(started_at: float):
+            # Another process refreshed the snapshot while we waited for the lock
+            snapshot = self.store.load(key)
+            return snapshot["payload"] if snapshot and snapshot["fetched_at"] >= started_at else None
+
+        def fetch():
+            return self.single_flight.do(
+                key,
+                lambda: self.store.refresh(key, lambda: self._fetch_upstream(username)),
+                recheck=stored_since
+            )
+
+        return self._profiles.get(key, fetch, ttl=self.ttl, load=load)
+
+    def prefetch(self, usernames: Iterable[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """Warm the profiles of several usernames concurrently and return them by username"""
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(usernames)),
+                                thread_name_prefix="profile-prefetch") as pool:
+            return dict(zip(usernames, pool.map(self.get, usernames)))
@@ -0,0 +1,210 @@
+"""
+Skill-match scoring for job recommendations
+
+``SkillMatcher`` encodes the job corpus once into a fixed token vocabulary,
+held as sparse incidence lists: for each token, the sorted rows of the jobs
+whose listed skills (or skills and description) contain it. A profile skill is
+the intersection of its tokens' rows, and scoring a whole profile is one
+weighted ``np.bincount`` over those rows, a sparse matrix-vector product. No
+job text is lowered, joined or scanned at recommendation time.
+
+Skills match on whole words, so "ML" no longer matches "HTML". A multi-word
+skill must appear as a phrase within one listed skill or within the
+description: the incidence lists only narrow down the candidates, which are
+then checked for the adjacent tokens.
+
+Scores never touch the (shared, immutable) job records: ``Recommendations``
+carries them next to the jobs, keyed by job id.
+
+Only a page of the best matches is ever materialized. ``top_k`` selects it with
+``np.partition`` in O(n + k log k), and a cursor (the score and position of the
+last job shown) lets "load more" continue from there. Positions only mean
+something for one candidate list and one profile, so a ``PageCursor`` also
+records the corpus version and a ``profile_fingerprint``; when either has
+changed, paging starts over from the first page.
+
+Set JOB_RECOMMENDATION_MODE=semantic to rank by embedding similarity instead
+(``job_embeddings``), with the profile described by ``profile_document``.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Hashable, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from job_index import tokenize
+from job_record import JobRecord
+
+RECOMMENDATION_MODE = os.environ.get("JOB_RECOMMENDATION_MODE", "skills").lower()  # "skills" or "semantic"
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+def _contains(sequence: Tuple[str, ...], phrase: Tuple[str, ...]) -> bool:
+    """Whether the phrase occurs as consecutive tokens of the sequence"""
+    width = len(phrase)
+    return any(sequence[start:start + width] == phrase
+               for start in range(len(sequence) - width + 1) if sequence[start] == phrase[0])
+
+
+Cursor = Tuple[float, int]  # (score, position) of the last item of a page
+
+
+class PageCursor(NamedTuple):
+    """Where a page of recommendations ended, and the ranking it belongs to"""
+
+    after: Cursor
+    corpus_version: int
+    profile: str  # profile_fingerprint of the ranked profile
+
+
+class Recommendations(NamedTuple):
+    """A page of recommended jobs, best match first, with the per-profile results keyed by job id.
+
+    ``next_cursor`` fetches the following page, or is None when this is the last one.
+    ``first_page`` is False only for a page that continues a previous one; a stale
+    cursor yields a first page again, which replaces the pages shown so far.
+    """
+
+    jobs: List[JobRecord]
+    scores: Dict[str, float]
+    matched_skills: Dict[str, List[str]]
+    next_cursor: Optional[PageCursor] = None
+    first_page: bool = True
+
+
+def profile_fingerprint(mode: str, skills: Mapping[str, float], document: str = "") -> str:
+    """Short hash of everything besides the corpus that a ranking depends on"""
+    payload = json.dumps([mode, sorted(skills.items()), document])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def profile_document(github_data: Mapping, skills: Iterable[str]) -> str:
+    """Free-text profile for semantic matching: skills plus repository descriptions, topics and languages"""
+    parts = list(skills)
+    for repo in github_data.get("repositories") or ():
+        parts.append(repo.get("description") or "")
+        parts.append(repo.get("language") or "")
+        parts.extend(repo.get("topics") or ())
+        parts.extend((repo.get("languages") or {}).keys())
+    # Topics are slugs ("computer-vision"); spaces let them match the words in postings
+    return " ".join(part.replace("-", " ") for part in parts if part)
+
+
+def top_k(scores: np.ndarray, k: int, min_score: float = 0.0,
+          cursor: Optional[Cursor] = None) -> Tuple[np.ndarray, bool]:
+    """Positions of the k best scores at or above min_score, best first, ties in position order.
+
+    With a cursor, only positions ranked after it are considered. Also returns
+    whether further positions remain after this page.
+    """
+    eligible = scores >= min_score
+    if cursor is not None:
+        after_score, after_position = cursor
+        positions = np.arange(len(scores))
+        eligible &= (scores < after_score) | ((scores == after_score) & (positions > after_position))
+    candidates = np.flatnonzero(eligible)
+    if k <= 0 or not len(candidates):
+        return candidates[:0], bool(len(candidates))
+
+    if len(candidates) > k:
+        # The k-th best score splits the candidates; everything above it is in, and
+        # ties at it are taken in position order until the page is full
+        candidate_scores = scores[candidates]
+        kth_score = -np.partition(-candidate_scores, k - 1)[k - 1]
+        above = candidates[candidate_scores > kth_score]
+        ties = candidates[candidate_scores == kth_score][:k - len(above)]
+        selected = np.concatenate([above, ties])
+    else:
+        selected = candidates
+    order = np.lexsort((selected, -scores[selected]))
+    return selected[order], len(candidates) > k
+
+
+class SkillMatcher:
+    """Job x skill incidence over the token vocabulary of a job corpus"""
+
+    def __init__(self, jobs: Iterable[Tuple[Hashable, Mapping]]):
+        keys: List[Hashable] = []
+        skill_counts: List[int] = []
+        listed: Dict[str, List[int]] = {}
+        mentioned: Dict[str, List[int]] = {}
+        # Token sequences of each job's listed skills and of its description, for phrase checks
+        self._listed_tokens: List[List[Tuple[str, ...]]] = []
+        self._description_tokens: List[Tuple[str, ...]] = []
+        for row, (key, job) in enumerate(jobs):
+            keys.append(key)
+            skills = list(job.get("skills") or ())
+            skill_counts.append(len(skills))
+            listed_tokens = [tuple(tokenize(skill)) for skill in skills]
+            description_tokens = tuple(tokenize(str(job.get("description") or "")))
+            self._listed_tokens.append(listed_tokens)
+            self._description_tokens.append(description_tokens)
+            skill_tokens = {token for tokens in listed_tokens for token in tokens}
+            for token in skill_tokens:
+                listed.setdefault(token, []).append(row)
+            for token in skill_tokens | set(description_tokens):
+                mentioned.setdefault(token, []).append(row)
+
+        self.keys = keys
+        self.rows: Dict[Hashable, int] = {key: row for row, key in enumerate(keys)}
+        self.skill_counts = np.array(skill_counts, dtype=float)
+        self.vocabulary = {token: code for code, token in enumerate(sorted(mentioned))}
+        self._listed = {token: np.array(rows, dtype=np.int64) for token, rows in listed.items()}
+        self._mentioned = {token: np.array(rows, dtype=np.int64) for token, rows in mentioned.items()}
+        self._columns: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def column(self, skill: str, listed_only: bool = False) -> np.ndarray:
+        """Sorted rows of the jobs containing a skill as a phrase (memoized per skill)"""
+        cache_key = (skill.lower(), listed_only)
+        if cache_key not in self._columns:
+            postings = self._listed if listed_only else self._mentioned
+            tokens = tuple(tokenize(skill))
+            rows = postings.get(tokens[0], _EMPTY) if tokens else _EMPTY
+            for token in tokens[1:]:
+                rows = np.intersect1d(rows, postings.get(token, _EMPTY), assume_unique=True)
+            if len(tokens) > 1:
+                # Every token occurs somewhere in these jobs; keep those where they are adjacent
+                rows = rows[np.array([self._has_phrase(row, tokens, listed_only) for row in rows], dtype=bool)]
+            self._columns[cache_key] = rows
+        return self._columns[cache_key]
+
+    def _has_phrase(self, row: int, tokens: Tuple[str, ...], listed_only: bool) -> bool:
+        sequences = list(self._listed_tokens[row])
+        if not listed_only:
+            sequences.append(self._description_tokens[row])
+        return any(_contains(sequence, tokens) for sequence in sequences)
+
+    def skill_matches(self, skills: Mapping[str, float]) -> np.ndarray:
+        """Weighted count of the skills each job mentions in its skills or description"""
+        columns = [self.column(skill) for skill in skills]
+        if not columns:
+            return np.zeros(len(self))
+        weights = np.repeat(np.fromiter(skills.values(), dtype=float, count=len(skills)),
+                            [len(column) for column in columns])
+        return np.bincount(np.concatenate(columns), weights=weights, minlength=len(self))
+
+    def match_scores(self, skills: Mapping[str, float]) -> np.ndarray:
+        """Match percentage of every job: matched skills relative to the number of skills it lists"""
+        matches = self.skill_matches(skills)
+        scores = np.zeros(len(self))
+        np.divide(matches * 100, self.skill_counts, out=scores, where=self.skill_counts > 0)
+        return scores
+
+    def matched_skills(self, key: Hashable, skills: Iterable[str]) -> List[str]:
+        """The skills a job lists among its own skills"""
+        row = self.rows.get(key)
+        if row is None:
+            return []
+        matched = []
+        for skill in skills:
+            column = self.column(skill, listed_only=True)
+            position = np.searchsorted(column, row)
+            if position < len(column) and column[position] == row:
+                matched.append(skill)
+        return matched
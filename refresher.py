@@ -0,0 +1,145 @@
+"""
+Stale-while-revalidate background refresher
+
+Holds the latest value for each registered key and renews it on a scheduler
+thread shortly before it expires. Readers always get the current value
+immediately, stale or not; only the very first read of a key waits for a load,
+and concurrent first reads share that one load.
+Keys nobody has read for a while are dropped so idle data stops costing
+upstream calls, and an optional entry cap evicts the least recently read key.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from singleflight import SingleFlight
+
+REFRESH_AHEAD = 120  # seconds before expiry at which a refresh is started
+TICK_INTERVAL = 15  # seconds between scheduler passes
+IDLE_TIMEOUT = 6 * 3600  # drop keys that have not been read for this long
+RETRY_DELAY = 300  # seconds to wait before retrying a failed refresh
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Serve cached values and renew them in the background before they expire"""
+
+    def __init__(self,
+                 refresh_ahead: float = REFRESH_AHEAD,
+                 tick_interval: float = TICK_INTERVAL,
+                 idle_timeout: float = IDLE_TIMEOUT,
+                 max_entries: Optional[int] = None,
+                 max_workers: int = 4):
+        self.refresh_ahead = refresh_ahead
+        self.tick_interval = tick_interval
+        self.idle_timeout = idle_timeout
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresher")
+        self._scheduler: Optional[threading.Thread] = None
+        self._flight = SingleFlight()
+
+    def get(self, key: str, fetch: Callable[[], Any], ttl: float,
+            load: Optional[Callable[[], Optional[Tuple[Any, float]]]] = None) -> Any:
+        """Return the value for key, registering it for background renewal on first use.
+
+        ``fetch`` produces a fresh value. ``load`` optionally returns a previously
+        persisted ``(value, fetched_at)`` pair so a cold key can be served without
+        waiting on ``fetch``; if that value is already due, it is renewed in the background.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["last_read"] = now
+                self._entries.move_to_end(key)
+                return entry["value"]
+
+        def cold_load() -> Tuple[Any, float]:
+            loaded = load() if load else None
+            return loaded if loaded is not None else (fetch(), time.time())
+
+        value, fetched_at = self._flight.do(key, cold_load)
+
+        with self._lock:
+            # Another session may have registered the key while we were loading
+            entry = self._entries.get(key)
+            if entry is None:
+                # An error payload is served but retried soon rather than kept for a full TTL
+                failed = _is_failure(value)
+                entry = {
+                    "value": value,
+                    "fetched_at": 0.0 if failed else fetched_at,
+                    "fetch": fetch,
+                    "ttl": ttl,
+                    "last_read": now,
+                    "refreshing": False,
+                    "retry_at": now + RETRY_DELAY if failed else 0.0
+                }
+                self._entries[key] = entry
+                while self.max_entries and len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)  # Least recently read
+        self._ensure_scheduler()
+        return entry["value"]
+
+    def _ensure_scheduler(self) -> None:
+        with self._lock:
+            if self._scheduler is not None and self._scheduler.is_alive():
+                return
+            self._scheduler = threading.Thread(target=self._run, name="refresher-scheduler", daemon=True)
+            self._scheduler.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.tick_interval)
+            self.refresh_due()
+
+    def refresh_due(self) -> None:
+        """Start background refreshes for every key close to expiry and drop idle keys"""
+        now = time.time()
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if now - e["last_read"] > self.idle_timeout]:
+                del self._entries[key]
+            due = [
+                key for key, entry in self._entries.items()
+                if not entry["refreshing"]
+                and now >= entry["retry_at"]
+                and now >= entry["fetched_at"] + entry["ttl"] - self.refresh_ahead
+            ]
+            for key in due:
+                self._entries[key]["refreshing"] = True
+        for key in due:
+            self._executor.submit(self._refresh, key)
+
+    def _refresh(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return
+        try:
+            value = entry["fetch"]()
+        except Exception:
+            logger.exception("Background refresh of %s failed; retrying in %ss", key, RETRY_DELAY)
+            value = None
+        else:
+            if _is_failure(value):
+                logger.warning("Background refresh of %s returned %r; retrying in %ss", key, value, RETRY_DELAY)
+        with self._lock:
+            entry["refreshing"] = False
+            if _is_failure(value):
+                # Keep serving the stale value and back off before trying again
+                entry["retry_at"] = time.time() + RETRY_DELAY
+            else:
+                entry["value"] = value
+                entry["fetched_at"] = time.time()
+
+
+def _is_failure(value: Any) -> bool:
+    """Whether a fetched value signals a failed fetch (None or an ``{"error": ...}`` payload)"""
+    return value is None or (isinstance(value, dict) and "error" in value)
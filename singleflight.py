@@ -0,0 +1,91 @@
+"""
+Request coalescing (single-flight)
+
+Concurrent callers asking for the same key share one in-flight call: the
+first caller runs it and the rest wait for its result. With a lock directory
+configured, the leader also takes a per-key lock file so only one process at a
+time fetches a key; a process that waited on the lock can pick up the result
+the previous holder stored instead of fetching again.
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, coalesce within the process only
+    fcntl = None
+
+LOCK_DIR = os.environ.get("SINGLEFLIGHT_LOCK_DIR")  # unset disables cross-process locking
+
+
+class _Call:
+    """An in-flight call that waiting callers can join"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key"""
+
+    def __init__(self, lock_dir: Optional[str] = None):
+        self.lock_dir = lock_dir
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        if lock_dir:
+            os.makedirs(lock_dir, exist_ok=True)
+
+    def do(self, key: str, fn: Callable[[], Any],
+           recheck: Optional[Callable[[float], Any]] = None) -> Any:
+        """Run fn once for all concurrent callers of key and return its result to each.
+
+        ``recheck(started_at)`` is called after acquiring the cross-process lock; if it
+        returns something other than None (e.g. a value another process stored after
+        ``started_at``), that is returned instead of calling fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, fn, recheck)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _run(self, key: str, fn: Callable[[], Any], recheck: Optional[Callable[[float], Any]]) -> Any:
+        if not self.lock_dir or fcntl is None:
+            return fn()
+
+        started_at = time.time()
+        lock_name = re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".lock"
+        with open(os.path.join(self.lock_dir, lock_name), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                if recheck is not None:
+                    cached = recheck(started_at)
+                    if cached is not None:
+                        return cached
+                return fn()
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
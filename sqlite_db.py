@@ -0,0 +1,36 @@
+"""
+SQLite helpers shared by the persistent stores
+
+Each store call opens its own connection, so a store can be shared across
+threads, and closes it again before returning. Databases run in WAL mode so
+readers never wait for a writer.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+BUSY_TIMEOUT = 5  # seconds to wait for another connection's write lock
+
+
+@contextmanager
+def connect(path: str) -> Iterator[sqlite3.Connection]:
+    """Connection for one unit of work: committed on success, rolled back on error, always closed"""
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def prepare_database(path: str, statements: Iterable[str]) -> None:
+    """Create the database (and its directory) in WAL mode and run the schema statements"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        for statement in statements:
+            conn.execute(statement)
@@ -0,0 +1,40 @@
+from github_graphql import fetch_github_profile_graphql
+from github_ratelimit import GitHubTokenPool
+from http_client import JSONResponse
+
+
+class FakeClient:
+    def __init__(self, response):
+        self.response = response
+
+    def post_json(self, url, payload, headers=None):
+        return self.response
+
+
+def test_rate_limited_errors_in_a_200_reply_exhaust_the_token():
+    pool = GitHubTokenPool(["token"])
+    reply = JSONResponse(200, {"data": {"user": None},
+                               "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]})
+
+    result = fetch_github_profile_graphql(FakeClient(reply), "someone", pool)
+
+    assert result == {"error": "GitHub rate limit exceeded"}
+    assert pool.degraded
+
+
+def test_query_errors_are_not_reported_as_a_missing_user():
+    pool = GitHubTokenPool(["token"])
+    reply = JSONResponse(200, {"data": None, "errors": [{"message": "Field 'x' doesn't exist"}]})
+
+    result = fetch_github_profile_graphql(FakeClient(reply), "someone", pool)
+
+    assert result == {"error": "GitHub GraphQL query failed: Field 'x' doesn't exist"}
+    assert not pool.degraded
+
+
+def test_not_found_user():
+    reply = JSONResponse(200, {"data": {"user": None}, "errors": [{"type": "NOT_FOUND", "message": "nope"}]})
+
+    result = fetch_github_profile_graphql(FakeClient(reply), "nobody", GitHubTokenPool(["token"]))
+
+    assert result == {"error": "User not found"}
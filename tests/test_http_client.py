@@ -0,0 +1,54 @@
+import json
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_client import RevalidatingClient
+
+
+def make_response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+class FakeSession:
+    """Answers 304 to a matching If-None-Match, else 200 with an ETag per URL and token"""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, headers=None, json=None, timeout=None):
+        headers = headers or {}
+        self.requests.append((url, dict(headers)))
+        etag = f'"{url}|{headers.get("Authorization")}"'
+        if headers.get("If-None-Match") == etag:
+            return make_response(304)
+        return make_response(200, {"url": url, "auth": headers.get("Authorization")}, {"ETag": etag})
+
+
+def test_revalidation_is_keyed_by_authorization():
+    client = RevalidatingClient()
+    client.session = FakeSession()
+
+    client.get_json("https://api.github.com/users/a", {"Authorization": "token one"})
+    second = client.get_json("https://api.github.com/users/a", {"Authorization": "token two"})
+    third = client.get_json("https://api.github.com/users/a", {"Authorization": "token one"})
+
+    assert not second.not_modified and second.data["auth"] == "token two"
+    assert third.not_modified and third.data["auth"] == "token one"
+
+
+def test_cached_responses_are_bounded():
+    client = RevalidatingClient(max_cached_responses=2)
+    client.session = FakeSession()
+
+    for name in ("a", "b", "a", "c"):
+        client.get_json(f"https://api.github.com/users/{name}")
+
+    assert [url for url, _ in client._entries] == ["https://api.github.com/users/a",
+                                                   "https://api.github.com/users/c"]
+    assert client.get_json("https://api.github.com/users/a").not_modified
+    assert not client.get_json("https://api.github.com/users/b").not_modified
@@ -0,0 +1,27 @@
+from job_index import JobIndex
+
+JOBS = [
+    {"title": "Backend Engineer", "description": "Build APIs on a PostgreSQL database.", "skills": ["Go"]},
+    {"title": "Frontend Developer", "description": "Ship interfaces.", "skills": ["JavaScript", "React"]},
+    {"title": "Data Analyst", "description": "Dashboards and reporting.", "skills": ["SQL"]},
+    {"title": "Platform Engineers", "description": "Services in Java.", "skills": ["Java"]},
+]
+
+
+def titles(index, keywords):
+    return [index.jobs[job_id]["title"] for job_id in index.search(keywords)]
+
+
+def test_aliases_match_whole_tokens_only():
+    index = JobIndex(JOBS)
+
+    # "database" starts with the alias "data" but is a different word
+    assert titles(index, ["scientist"]) == ["Data Analyst"]
+    assert titles(index, ["analyst"]) == ["Data Analyst"]
+
+
+def test_query_words_match_inflections_not_longer_words():
+    index = JobIndex(JOBS)
+
+    assert titles(index, ["java"]) == ["Platform Engineers"]
+    assert titles(index, ["engineer"]) == ["Backend Engineer", "Frontend Developer", "Platform Engineers"]
@@ -0,0 +1,40 @@
+from job_index import JobIndex
+from job_sources import FixtureJobSource
+from job_store import JobStore
+
+
+def fingerprints(index):
+    return sorted(job.fingerprint for _, job in index.live_jobs())
+
+
+def test_indexes_sharing_a_store_converge(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store_a, store_b = JobStore(path, expire_after=3600), JobStore(path, expire_after=3600)
+    index_a, index_b = JobIndex(), JobIndex()
+    index_a.sync(store_a)
+    index_b.sync(store_b)
+    jobs = FixtureJobSource().load(None)
+
+    # Process A ingests first; B's own ingest then finds every posting already stored
+    index_a.sync(store_a, jobs)
+    index_b.sync(store_b, jobs)
+
+    assert len(index_b) == len(index_a) > 0
+    assert fingerprints(index_b) == fingerprints(index_a)
+
+    # Postings A expires disappear from B on its next sync
+    store_a.ingest(jobs[1:], now=store_a.last_ingested_at() + 7200)
+    index_b.sync(store_b)
+    assert fingerprints(index_b) == sorted(store_b.active_jobs())
+    assert len(index_b) < len(index_a)
+
+
+def test_sync_without_changes_leaves_the_index_alone(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    index = JobIndex()
+    index.sync(store, FixtureJobSource().load(None))
+    version = index.version
+
+    index.sync(store, FixtureJobSource().load(None))
+
+    assert index.version == version
@@ -0,0 +1,45 @@
+import pytest
+
+from job_normalize import DEFAULT_POSTING_AGE, parse_posted, parse_salary
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+
+@pytest.mark.parametrize("text, age", [
+    ("2 days ago", 2 * DAY),
+    ("yesterday", DAY),
+    ("Posted Yesterday", DAY),
+    ("an hour ago", 3600),
+    ("30+ days ago", 30 * DAY),
+    ("1 week ago", 7 * DAY),
+    ("today", 0),
+    ("just posted", 0),
+    ("someday", DEFAULT_POSTING_AGE),
+    ("", DEFAULT_POSTING_AGE),
+])
+def test_parse_posted(text, age):
+    assert parse_posted(text, NOW) == NOW - age
+
+
+@pytest.mark.parametrize("text, low, high, currency, period", [
+    ("$120,000 - $180,000", 120_000, 180_000, "USD", "year"),
+    ("KES 1,500,000 - KES 2,500,000", 1_500_000, 2_500_000, "KES", "year"),
+    ("$25 - $40/hour", 25, 40, "USD", "hour"),
+    ("€4,000 - €6,000/month", 4_000, 6_000, "EUR", "month"),
+    ("50k-80k EUR", 50_000, 80_000, "EUR", "year"),
+    ("$50k to $70k a year", 50_000, 70_000, "USD", "year"),
+    ("120,000 - 180,000", 120_000, 180_000, "USD", "year"),
+    ("Up to $150,000 + 401(k)", 150_000, 150_000, "USD", "year"),
+    ("80,000 USD per year", 80_000, 80_000, "USD", "year"),
+])
+def test_parse_salary(text, low, high, currency, period):
+    salary = parse_salary(text)
+
+    assert (salary["salary_min"], salary["salary_max"]) == (low, high)
+    assert (salary["salary_currency"], salary["salary_period"]) == (currency, period)
+
+
+@pytest.mark.parametrize("text", ["Not specified", "Competitive", "2 weeks PTO", "401(k) match"])
+def test_stray_numbers_are_not_salaries(text):
+    assert parse_salary(text)["salary_annual_usd"] is None
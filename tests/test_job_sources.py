@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from http_client import RevalidatingClient
+from job_sources import FixtureJobSource, JobSource, RemoteOKJobSource, fetch_job_listings
+
+
+class FailingSource(FixtureJobSource):
+    name = "failing"
+
+    def fetch(self, client):
+        raise RuntimeError("board is down")
+
+
+class SlowSource(FixtureJobSource):
+    name = "slow"
+    timeout = 0.2
+
+    def __init__(self, release: threading.Event):
+        super().__init__()
+        self.release = release
+
+    def fetch(self, client):
+        self.release.wait(5)
+        return super().fetch(client)
+
+
+@pytest.fixture
+def client():
+    return RevalidatingClient()
+
+
+def test_fixture_source_loads_sample_jobs(client):
+    jobs, errors = fetch_job_listings([FixtureJobSource()], client)
+
+    assert errors == {}
+    assert jobs and all(job["title"] and job["company"] for job in jobs)
+
+
+def test_failing_and_slow_sources_return_partial_results(client):
+    release = threading.Event()
+    try:
+        jobs, errors = fetch_job_listings([SlowSource(release), FailingSource(), FixtureJobSource()], client)
+    finally:
+        release.set()
+
+    assert len(jobs) == len(FixtureJobSource().load(client))
+    assert errors == {"slow": "timed out after 0.2s", "failing": "board is down"}
+
+
+def test_job_source_is_abstract():
+    with pytest.raises(TypeError):
+        JobSource()
+
+
+def test_remoteok_tolerates_null_tags():
+    jobs = RemoteOKJobSource().normalize([{"legal": "notice"}, {"position": "Data Engineer", "tags": None}])
+
+    assert [job["skills"] for job in jobs] == [[]]
@@ -0,0 +1,51 @@
+import job_sources
+from job_sources import FixtureJobSource, RemoteOKJobSource
+from job_store import JobStore, job_fingerprint
+
+REMOTEOK_ITEM = {
+    "position": "Backend Engineer", "company": "Acme", "location": "Remote", "epoch": 1_700_000_000,
+    "description": "<p>Build <b>APIs</b> in Python.</p>", "tags": ["python", "postgres"],
+    "url": "https://remoteok.com/remote-jobs/1",
+}
+
+
+def test_clock_derived_posted_text_is_not_an_update(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    source = RemoteOKJobSource()
+
+    monkeypatch.setattr(job_sources.time, "time", lambda: 1_700_000_000 + 2 * 3600)
+    first = store.ingest(source.normalize([REMOTEOK_ITEM]), now=1000.0)
+    monkeypatch.setattr(job_sources.time, "time", lambda: 1_700_000_000 + 5 * 3600)
+    second = store.ingest(source.normalize([REMOTEOK_ITEM]), now=1000.0 + 3600)
+
+    assert len(first.added) == 1
+    assert not second
+
+
+def test_ingest_reports_only_the_delta(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"), expire_after=3600)
+    jobs = FixtureJobSource().load(None)
+
+    first = store.ingest(jobs, now=0.0)
+    assert len(first.added) == len(store.active_jobs()) and not first.updated and not first.removed
+    assert not store.ingest(jobs, now=60.0)
+
+    edited = [dict(job) for job in jobs[1:]]
+    edited[0]["salary"] = "$1 - $2"
+    second = store.ingest(edited, now=120.0)
+    assert not second.added and list(second.updated) == [job_fingerprint(edited[0])]
+    assert second.updated[job_fingerprint(edited[0])]["salary_max"] == 2.0
+
+    # The dropped posting survives until it has gone unseen for expire_after
+    assert not store.ingest(edited, now=3000.0).removed
+    assert store.ingest(edited, now=3700.0).removed == [job_fingerprint(jobs[0])]
+
+
+def test_same_posting_from_two_sources_is_stored_once(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = FixtureJobSource().load(None)[0]
+
+    delta = store.ingest([job, dict(job, source="Other Board")], now=0.0)
+
+    assert len(delta.added) == 1
+    assert len(store.active_jobs()) == 1
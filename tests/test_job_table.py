@@ -0,0 +1,102 @@
+import itertools
+import json
+from collections import Counter
+
+import numpy as np
+
+from job_sources import SAMPLE_JOBS_PATH
+from job_table import JobTable
+
+LOCATIONS = ["Any", "Remote", "On-site", "Hybrid", "Nairobi", "Kenya", "Africa", "San Francisco",
+             "New York", "Seattle", "Austin", "London", "Berlin", "Toronto", "Sydney"]
+EXPERIENCE_LEVELS = ["All", "Entry Level", "Mid Level", "Senior Level", "Student"]
+JOB_TYPES = ["All", "Full-time", "Internship", "Contract", "Part-time"]
+VISA_OPTIONS = ["Any", "Required", "Not Required"]
+
+
+def reference_match(job, location, experience_level, job_type, visa_sponsorship):
+    """The per-job filter logic the vectorized masks replaced"""
+    job_location = job["location"].lower()
+    location_filter = location.lower()
+    if location_filter == "any":
+        location_match = True
+    elif location_filter == "remote" and job["remote_friendly"]:
+        location_match = True
+    elif location_filter == "on-site" and not job["remote_friendly"]:
+        location_match = True
+    elif location_filter == "hybrid" and ("hybrid" in job_location or job["remote_friendly"]):
+        location_match = True
+    elif location_filter in job_location:
+        location_match = True
+    elif location_filter == "nairobi" and ("remote" in job_location or "nairobi" in job_location):
+        location_match = True
+    elif location_filter == "kenya" and any(term in job_location for term in ("remote", "nairobi", "kenya")):
+        location_match = True
+    elif location_filter == "africa" and any(term in job_location for term in ("remote", "nairobi", "africa")):
+        location_match = True
+    else:
+        location_match = job["remote_friendly"] and location_filter in [
+            "san francisco", "new york", "seattle", "austin", "london", "berlin", "toronto", "sydney"]
+
+    experience_match = True
+    job_exp = job["experience"].lower()
+    exp_filter = experience_level.lower()
+    if exp_filter == "entry level" and job_exp != "entry level":
+        experience_match = False
+    elif exp_filter == "mid level" and job_exp not in ["mid level", "entry level"]:
+        experience_match = False
+    elif exp_filter == "senior level" and job_exp != "senior level":
+        experience_match = False
+    elif exp_filter == "student" and job_exp != "student":
+        experience_match = False
+
+    job_type_match = job_type.lower() == "all" or job_type.lower() == job["type"].lower()
+
+    visa = job.get("visa_sponsorship", False)
+    visa_match = not (visa_sponsorship.lower() == "required" and not visa
+                      or visa_sponsorship.lower() == "not required" and visa)
+
+    return location_match and experience_match and job_type_match and visa_match
+
+
+def test_filter_masks_match_per_job_logic():
+    with open(SAMPLE_JOBS_PATH, encoding="utf-8") as handle:
+        jobs = json.load(handle)
+    table = JobTable(jobs)
+
+    for filters in itertools.product(LOCATIONS, EXPERIENCE_LEVELS, JOB_TYPES, VISA_OPTIONS):
+        expected = [reference_match(job, *filters) for job in jobs]
+        np.testing.assert_array_equal(table.filter_mask(*filters), expected, err_msg=str(filters))
+
+
+def test_removed_and_replaced_rows():
+    table = JobTable([
+        {"type": "Full-time", "experience": "Entry Level", "location": "Remote", "remote_friendly": True},
+        {"type": "Internship", "experience": "Student", "location": "Nairobi, Kenya"},
+    ])
+    table.remove(0)
+    table.set_row(1, {"type": "Contract", "experience": "Senior Level", "location": "Berlin"})
+
+    np.testing.assert_array_equal(table.filter_mask(), [False, True])
+    np.testing.assert_array_equal(table.filter_mask(job_type="Contract"), [False, True])
+    np.testing.assert_array_equal(table.filter_mask(location="Kenya"), [False, False])
+
+
+def test_facet_counts_follow_in_place_edits():
+    with open(SAMPLE_JOBS_PATH, encoding="utf-8") as handle:
+        jobs = json.load(handle)
+    table = JobTable(jobs)
+    current = list(jobs)
+    for row in range(0, len(jobs), 3):
+        table.set_row(row, jobs[-1 - row])
+        current[row] = jobs[-1 - row]
+    for row in range(1, len(jobs), 4):
+        table.remove(row)
+        current[row] = None
+
+    counts = table.facet_counts(np.ones(len(table), dtype=bool))
+
+    live = [job for job in current if job is not None]
+    assert counts["company"] == dict(Counter(job["company"] for job in live))
+    assert counts["skill"] == dict(Counter(skill for job in live for skill in job["skills"]))
+    assert sum(counts["type"].values()) == len(live)
@@ -0,0 +1,28 @@
+import numpy as np
+
+from recommendations import SkillMatcher
+
+
+def test_multi_word_skill_must_appear_as_a_phrase():
+    jobs = [
+        ("scattered", {"skills": ["Computer Science", "Vision API"],
+                       "description": "Engineering great software for our users."}),
+        ("phrase", {"skills": ["Computer Vision", "Python"],
+                    "description": "Software engineering on perception models."}),
+    ]
+    matcher = SkillMatcher(jobs)
+    profile = {"Computer Vision": 1.0, "Software Engineering": 1.0}
+
+    scores = matcher.match_scores(profile)
+
+    assert scores[matcher.rows["scattered"]] == 0.0
+    assert scores[matcher.rows["phrase"]] == 100.0
+    assert matcher.matched_skills("scattered", profile) == []
+    assert matcher.matched_skills("phrase", profile) == ["Computer Vision"]
+
+
+def test_phrase_does_not_span_two_listed_skills():
+    matcher = SkillMatcher([("job", {"skills": ["Machine", "Learning"], "description": ""})])
+
+    assert len(matcher.column("Machine Learning", listed_only=True)) == 0
+    np.testing.assert_array_equal(matcher.column("learning"), [0])
@@ -0,0 +1,19 @@
+import logging
+
+from refresher import BackgroundRefresher
+
+
+def test_failed_background_refresh_is_logged_and_keeps_the_stale_value(caplog):
+    refresher = BackgroundRefresher()
+    assert refresher.get("key", lambda: "first", ttl=3600) == "first"
+
+    def fail():
+        raise RuntimeError("database is locked")
+
+    refresher._entries["key"]["fetch"] = fail
+    with caplog.at_level(logging.ERROR, logger="refresher"):
+        refresher._refresh("key")
+
+    assert "Background refresh of key failed" in caplog.text
+    assert "database is locked" in caplog.text
+    assert refresher.get("key", fail, ttl=3600) == "first"
@@ -0,0 +1,35 @@
+import sqlite3
+
+import pytest
+
+from github_store import GitHubSnapshotStore
+from sqlite_db import connect
+
+
+def test_connection_is_closed_after_use(tmp_path):
+    with connect(str(tmp_path / "db.sqlite3")) as conn:
+        conn.execute("CREATE TABLE t (x)")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_failed_unit_of_work_is_rolled_back(tmp_path):
+    path = str(tmp_path / "db.sqlite3")
+    with connect(path) as conn:
+        conn.execute("CREATE TABLE t (x)")
+    with pytest.raises(RuntimeError):
+        with connect(path) as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            raise RuntimeError
+
+    with connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_snapshot_round_trip(tmp_path):
+    store = GitHubSnapshotStore(str(tmp_path / "cache" / "snapshots.sqlite3"))
+    store.save("github_data:someone", {"user": {"name": "Someone"}}, fetched_at=10.0)
+
+    assert store.load("github_data:someone") == {"payload": {"user": {"name": "Someone"}}, "fetched_at": 10.0}
+    assert store.load("github_data:nobody") is None